@@ -57,6 +57,7 @@ def import_url(
     urls: str | list[str],
     *,
     strict: bool = False,
+    workers: int | None = None,
 ) -> ImportResult:
     if isinstance(urls, str):
         product = import_product_from_url(urls)
@@ -64,6 +65,7 @@ def import_url(
 
     products, errors = import_products_from_urls(
         list(urls),
+        workers=workers,
     )
     if strict and errors:
         raise ValueError(f"Strict mode failed with {len(errors)} URL import error(s).")
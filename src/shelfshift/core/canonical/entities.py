@@ -7,13 +7,13 @@ WeightUnit = Literal["g", "kg", "lb", "oz"]
 MediaType = Literal["image", "video"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Money:
     amount: Decimal | None = None
     currency: Currency | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Price:
     current: Money = field(default_factory=Money)
     compare_at: Money | None = None
@@ -22,13 +22,13 @@ class Price:
     max_price: Money | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Weight:
     value: Decimal | None = None
     unit: WeightUnit = "g"
 
 
-@dataclass
+@dataclass(slots=True)
 class Media:
     url: str
     type: MediaType = "image"
@@ -38,19 +38,19 @@ class Media:
     variant_skus: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionDef:
     name: str
     values: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionValue:
     name: str
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Inventory:
     track_quantity: bool | None = None
     quantity: int | None = None
@@ -58,13 +58,13 @@ class Inventory:
     allow_backorder: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Seo:
     title: str | None = None
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceRef:
     platform: str
     id: str | None = None
@@ -72,18 +72,18 @@ class SourceRef:
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CategorySet:
     paths: list[list[str]] = field(default_factory=list)
     primary: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifiers:
     values: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Variant:
     id: str | None = None
     sku: str | None = None
@@ -140,7 +140,7 @@ class Variant:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     source: SourceRef = field(default_factory=lambda: SourceRef(platform="unknown"))
     title: str | None = None
@@ -398,12 +398,15 @@ def _normalize_option_defs(
         elif isinstance(item, dict):
             name = _clean_text(item.get("name"))
             raw_values = item.get("values")
-            if isinstance(raw_values, (list, tuple)):
-                option_values = _ordered_unique_strings(list(raw_values))
-            elif raw_values is None:
+            if raw_values is None:
                 option_values = []
-            else:
+            elif isinstance(raw_values, str):
                 option_values = _ordered_unique_strings([raw_values])
+            else:
+                try:
+                    option_values = _ordered_unique_strings(list(raw_values))
+                except TypeError:
+                    option_values = _ordered_unique_strings([raw_values])
         else:
             continue
         if not name:
@@ -13,6 +13,20 @@ def parse_decimal_money(value: Any) -> Decimal | None:
     if value is None:
         return None
 
+    # CSV cells and most API payload prices arrive as strings; check that type first.
+    if isinstance(value, str):
+        cleaned = value.strip()
+        # Plain "1299"/"19.99" strings are already sanitized; skip the regex pass for them.
+        if not (cleaned.isascii() and cleaned.replace(".", "", 1).isdigit()):
+            cleaned = _MONEY_SANITIZE_RE.sub("", cleaned.replace(",", ""))
+        if cleaned in {"", "-", ".", "-."}:
+            return None
+        try:
+            parsed = Decimal(cleaned)
+        except InvalidOperation:
+            return None
+        return parsed if parsed.is_finite() else None
+
     if isinstance(value, Decimal):
         return value if value.is_finite() else None
 
@@ -28,16 +42,6 @@ def parse_decimal_money(value: Any) -> Decimal | None:
             return None
         return parsed if parsed.is_finite() else None
 
-    if isinstance(value, str):
-        cleaned = _MONEY_SANITIZE_RE.sub("", value.strip().replace(",", ""))
-        if cleaned in {"", "-", ".", "-."}:
-            return None
-        try:
-            parsed = Decimal(cleaned)
-        except InvalidOperation:
-            return None
-        return parsed if parsed.is_finite() else None
-
     return None
 
 
@@ -92,8 +96,18 @@ def resolve_option_defs(product: Product) -> list[OptionDef]:
     return resolved
 
 
-def resolve_variant_option_values(product: Product, variant: Variant) -> list[OptionValue]:
-    ordered_defs = [option.name for option in resolve_option_defs(product)]
+def resolve_variant_option_values(
+    product: Product,
+    variant: Variant,
+    *,
+    option_names: list[str] | None = None,
+) -> list[OptionValue]:
+    # Callers walking many variants pass the resolved product option names once.
+    ordered_defs = (
+        option_names
+        if option_names is not None
+        else [option.name for option in resolve_option_defs(product)]
+    )
 
     by_name: dict[str, str] = {}
     for option in variant.option_values:
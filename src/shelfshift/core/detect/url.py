@@ -1,6 +1,7 @@
 """Product URL detection."""
 
 import re
+from functools import lru_cache
 from urllib.parse import parse_qs, unquote, urlparse
 
 _AMAZON_ASIN_RE = re.compile(r"/(?:gp/product|dp)/([A-Z0-9]{10})(?:[/?#]|$)", re.I)
@@ -15,19 +16,26 @@ _SHOPIFY_PRODUCT_RE = re.compile(
     rf"^/{_LOCALE_PREFIX_RE}(?:collections/[^/]+/)?products/([^/?#]+?)(?:\.(?:js|json))?/?$",
     re.I,
 )
-_WOOCOMMERCE_PRODUCT_RE = re.compile(
-    rf"^/{_LOCALE_PREFIX_RE}product/([^/?#]+)/?$",
-    re.I,
-)
 _WOOCOMMERCE_STORE_API_PRODUCT_RE = re.compile(
     r"^/wp-json/wc/store/v1/products/([^/?#]+)/?$",
     re.I,
 )
-_WOOCOMMERCE_API_RE = re.compile(r"^/wp-json/wc/(?:store/v1|v[1-9]+)/", re.I)
+# Woo product page, Store API product and generic Woo API paths in one anchored scan;
+# alternatives are tried in this order, matching the precedence of the separate checks.
+_WOOCOMMERCE_PATH_RE = re.compile(
+    rf"^/(?:{_LOCALE_PREFIX_RE}product/(?P<slug>[^/?#]+)/?$"
+    r"|wp-json/wc/store/v1/products/(?P<token>[^/?#]+)/?$"
+    r"|(?P<api>wp-json/wc/(?:store/v1|v[1-9]+)/))",
+    re.I,
+)
 _SQUARESPACE_PRODUCT_RE = re.compile(r"^/(?:shop|store)/(?:p/)?([a-z0-9-]+)/?$", re.I)
 _SQUARESPACE_SHOP_PATH_RE = re.compile(r"^/(?:shop|store)(?:/|$)", re.I)
+_ASIN_RE = re.compile(r"[A-Z0-9]{10}", re.I)
+_NUMERIC_ID_RE = re.compile(r"\d+")
 
 
+# Path extractors are pure and rerun by clients after detection; results are immutable.
+@lru_cache(maxsize=1024)
 def extract_shopify_slug_from_path(path: str) -> str | None:
     match = _SHOPIFY_PRODUCT_RE.search(path or "")
     if not match:
@@ -35,6 +43,7 @@ def extract_shopify_slug_from_path(path: str) -> str | None:
     return match.group(1)
 
 
+@lru_cache(maxsize=1024)
 def extract_woocommerce_store_api_product_token(path: str) -> str | None:
     match = _WOOCOMMERCE_STORE_API_PRODUCT_RE.search(path or "")
     if not match:
@@ -46,6 +55,12 @@ def detect_product_url(url: str) -> dict:
     """
     Returns: {'platform', 'is_product', 'product_id', 'slug'}
     """
+    # Import flows detect the same URL several times; hand out a copy of the cached result.
+    return dict(_detect_product_url_cached(url))
+
+
+@lru_cache(maxsize=1024)
+def _detect_product_url_cached(url: str) -> dict:
     res = {"platform": None, "is_product": False, "product_id": None, "slug": None}
     try:
         parsed = urlparse(url)
@@ -54,7 +69,8 @@ def detect_product_url(url: str) -> dict:
 
     host = (parsed.netloc or "").lower()
     path = parsed.path or ""
-    query = parse_qs(parsed.query)
+    # Most product URLs carry no query string, so skip parse_qs for them.
+    query = parse_qs(parsed.query) if parsed.query else {}
 
     if "amazon." in host:
         match = _AMAZON_ASIN_RE.search(path)
@@ -63,7 +79,7 @@ def detect_product_url(url: str) -> dict:
             return res
         for key in ("asin", "ASIN"):
             values = query.get(key) or []
-            if values and re.fullmatch(r"[A-Z0-9]{10}", values[0], re.I):
+            if values and _ASIN_RE.fullmatch(values[0]):
                 res.update(platform="amazon", is_product=True, product_id=values[0])
                 return res
         res.update(platform="amazon")
@@ -79,22 +95,23 @@ def detect_product_url(url: str) -> dict:
 
     # Run Woo/Squarespace checks before Shopify fallback path checks to avoid
     # classifying other platforms as Shopify from generic /products paths.
-    match = _WOOCOMMERCE_PRODUCT_RE.search(path)
-    if match:
-        res.update(platform="woocommerce", is_product=True, slug=match.group(1))
+    woo_match = _WOOCOMMERCE_PATH_RE.search(path)
+    woo_kind = woo_match.lastgroup if woo_match else None
+    if woo_kind == "slug":
+        res.update(platform="woocommerce", is_product=True, slug=woo_match.group("slug"))
         return res
     product_values = query.get("product") or []
-    if product_values and re.fullmatch(r"\d+", product_values[0]):
+    if product_values and _NUMERIC_ID_RE.fullmatch(product_values[0]):
         res.update(platform="woocommerce", is_product=True, product_id=product_values[0])
         return res
-    token = extract_woocommerce_store_api_product_token(path)
-    if token:
-        if re.fullmatch(r"\d+", token):
+    if woo_kind == "token":
+        token = unquote(woo_match.group("token"))
+        if _NUMERIC_ID_RE.fullmatch(token):
             res.update(platform="woocommerce", is_product=True, product_id=token)
         else:
             res.update(platform="woocommerce", is_product=True, slug=token)
         return res
-    if _WOOCOMMERCE_API_RE.search(path):
+    if woo_kind == "api":
         res.update(platform="woocommerce")
         return res
 
@@ -1,5 +1,7 @@
 """Public exporter routing helpers."""
 
+from datetime import datetime
+
 from ..canonical import Product
 from .platforms.bigcommerce import product_to_bigcommerce_csv
 from .platforms.shopify import product_to_shopify_csv
@@ -18,21 +20,27 @@ def export_csv_for_target(
     bigcommerce_csv_format: str = "modern",
     squarespace_product_page: str = "",
     squarespace_product_url: str = "",
+    now: datetime | None = None,
 ) -> tuple[str, str]:
     target = (target_platform or "").strip().lower()
     resolved_weight_unit = resolve_weight_unit(target, weight_unit)
 
     if target == "shopify":
-        return product_to_shopify_csv(product, publish=publish, weight_unit=resolved_weight_unit)
+        return product_to_shopify_csv(
+            product, publish=publish, weight_unit=resolved_weight_unit, now=now
+        )
     if target == "bigcommerce":
         return product_to_bigcommerce_csv(
             product,
             publish=publish,
             csv_format=bigcommerce_csv_format,
             weight_unit=resolved_weight_unit,
+            now=now,
         )
     if target == "wix":
-        return product_to_wix_csv(product, publish=publish, weight_unit=resolved_weight_unit)
+        return product_to_wix_csv(
+            product, publish=publish, weight_unit=resolved_weight_unit, now=now
+        )
     if target == "squarespace":
         return product_to_squarespace_csv(
             product,
@@ -40,10 +48,11 @@ def export_csv_for_target(
             product_page=squarespace_product_page,
             product_url=squarespace_product_url,
             weight_unit=resolved_weight_unit,
+            now=now,
         )
     if target == "woocommerce":
         return product_to_woocommerce_csv(
-            product, publish=publish, weight_unit=resolved_weight_unit
+            product, publish=publish, weight_unit=resolved_weight_unit, now=now
         )
     raise ValueError(
         "target_platform must be one of: shopify, bigcommerce, wix, squarespace, woocommerce"
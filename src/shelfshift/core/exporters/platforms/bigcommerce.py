@@ -1,8 +1,7 @@
 import re
+from datetime import datetime
 from typing import Literal
 
-from slugify import slugify
-
 from ...canonical import Product, Variant
 from ...csv_schemas.bigcommerce import BIGCOMMERCE_COLUMNS, BIGCOMMERCE_LEGACY_COLUMNS
 from ..shared import utils
@@ -95,12 +94,16 @@ _COLOR_OPTION_TYPE = "Swatch"
 _SWATCH_VALUE_DATA_RE = re.compile(r"\[#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\]$")
 
 
+_EMPTY_ROW_TEMPLATE: dict[str, str] = dict.fromkeys(BIGCOMMERCE_COLUMNS, "")
+_EMPTY_LEGACY_ROW_TEMPLATE: dict[str, str] = dict.fromkeys(BIGCOMMERCE_LEGACY_COLUMNS, "")
+
+
 def _empty_row() -> dict[str, str]:
-    return dict.fromkeys(BIGCOMMERCE_COLUMNS, "")
+    return _EMPTY_ROW_TEMPLATE.copy()
 
 
 def _empty_legacy_row() -> dict[str, str]:
-    return dict.fromkeys(BIGCOMMERCE_LEGACY_COLUMNS, "")
+    return _EMPTY_LEGACY_ROW_TEMPLATE.copy()
 
 
 def _set_cell(row: dict[str, str], header: str, value: str, *, schema: str) -> None:
@@ -136,7 +139,7 @@ def _resolve_price(product: Product, variant: Variant | None = None) -> str:
 
 def _resolve_product_key(product: Product) -> str:
     for candidate in (product.source.id, product.source.slug, product.title):
-        key = slugify(str(candidate or ""), separator="-")
+        key = utils.cached_slugify(str(candidate or ""))
         if key:
             return key
     return "item"
@@ -170,23 +173,16 @@ def _has_any_inventory_quantity(variants: list[Variant]) -> bool:
 
 
 def _resolve_option_names(product: Product, variants: list[Variant]) -> list[str]:
-    option_names = [option.name for option in utils.resolve_option_defs(product) if option.name]
+    option_names = utils.resolve_option_names(product)
     if not option_names and len(variants) > 1:
         return ["Option"]
     return option_names
 
 
-def _is_variable_product(
-    product: Product, variants: list[Variant], option_names: list[str]
-) -> bool:
-    if len(variants) > 1:
-        return True
-    if option_names:
-        return True
-    for option in utils.resolve_option_defs(product):
-        if len(utils.ordered_unique(option.values)) > 1:
-            return True
-    return False
+def _is_variable_product(variants: list[Variant], option_names: list[str]) -> bool:
+    # option_names is only empty when the product defines no named options, so there
+    # is no option-value scan left to do.
+    return len(variants) > 1 or bool(option_names)
 
 
 def _fallback_variant_option_value(variant: Variant, index: int) -> str:
@@ -251,10 +247,10 @@ def _resolve_inventory_mode(*, is_variable: bool, has_inventory: bool) -> str:
 
 def _resolve_product_url_slug(product: Product) -> str:
     if product.source.slug:
-        cleaned = slugify(product.source.slug, separator="-")
+        cleaned = utils.cached_slugify(product.source.slug)
         if cleaned:
             return f"/{cleaned}/"
-    title_slug = slugify(str(product.title or ""), separator="-")
+    title_slug = utils.cached_slugify(str(product.title or ""))
     if title_slug:
         return f"/{title_slug}/"
     return ""
@@ -275,7 +271,7 @@ def _resolve_stock_for_variant_row(variant: Variant) -> str:
 
 
 def _resolve_keywords_from_tags(tags: list[str] | None) -> str:
-    return ",".join(utils.ordered_unique(tags or []))
+    return utils.join_unique(tags or [], ",")
 
 
 def _resolve_product_weight_grams(product: Product, variants: list[Variant]) -> float | None:
@@ -301,14 +297,9 @@ def _resolve_modern_categories(product: Product) -> str:
 
 
 def _resolve_legacy_image_urls(product: Product) -> list[str]:
+    # ordered_unique drops the empty results of unusable URLs in the same pass.
     return utils.ordered_unique(
-        [
-            url
-            for url in (
-                _normalize_image_url(image) for image in utils.resolve_product_image_urls(product)
-            )
-            if url
-        ]
+        map(_normalize_image_url, utils.resolve_product_image_urls(product))
     )
 
 
@@ -321,7 +312,7 @@ def _product_to_bigcommerce_legacy_rows(
     is_visible = utils.resolve_product_visibility(product, publish_override=publish)
     variants = utils.resolve_variants(product)
     option_names = _resolve_option_names(product, variants)
-    is_variable = _is_variable_product(product, variants, option_names)
+    is_variable = _is_variable_product(variants, option_names)
     has_inventory = _has_any_inventory_quantity(variants)
     inventory_mode = _resolve_inventory_mode(is_variable=is_variable, has_inventory=has_inventory)
     parent_sku = _resolve_parent_sku(product, variants, is_variable=is_variable)
@@ -397,7 +388,7 @@ def _product_to_bigcommerce_modern_rows(
     is_visible = utils.resolve_product_visibility(product, publish_override=publish)
     variants = utils.resolve_variants(product)
     option_names = _resolve_option_names(product, variants)
-    is_variable = _is_variable_product(product, variants, option_names)
+    is_variable = _is_variable_product(variants, option_names)
     has_inventory = _has_any_inventory_quantity(variants)
     inventory_mode = _resolve_inventory_mode(is_variable=is_variable, has_inventory=has_inventory)
     parent_sku = _resolve_parent_sku(product, variants, is_variable=is_variable)
@@ -461,9 +452,14 @@ def _product_to_bigcommerce_modern_rows(
     rows.append(product_row)
 
     if is_variable:
+        free_shipping = "TRUE" if not product.requires_shipping else "FALSE"
+        visible = "TRUE" if is_visible else "FALSE"
+        product_option_names = [option.name for option in utils.resolve_option_defs(product)]
         for index, variant in enumerate(variants, start=1):
             variant_row = _empty_row()
-            variant_option_values = utils.resolve_variant_option_map(product, variant)
+            variant_option_values = utils.resolve_variant_option_map(
+                product, variant, option_names=product_option_names
+            )
             _set_cell(variant_row, MH.item, "Variant", schema="modern")
             _set_cell(
                 variant_row,
@@ -479,15 +475,8 @@ def _product_to_bigcommerce_modern_rows(
                 schema="modern",
             )
             _set_cell(variant_row, MH.low_stock, "0", schema="modern")
-            _set_cell(
-                variant_row,
-                MH.free_shipping,
-                "TRUE" if not product.requires_shipping else "FALSE",
-                schema="modern",
-            )
-            _set_cell(
-                variant_row, MH.is_visible, "TRUE" if is_visible else "FALSE", schema="modern"
-            )
+            _set_cell(variant_row, MH.free_shipping, free_shipping, schema="modern")
+            _set_cell(variant_row, MH.is_visible, visible, schema="modern")
             _set_cell(variant_row, MH.show_product_condition, "FALSE", schema="modern")
             _set_cell(
                 variant_row,
@@ -516,13 +505,7 @@ def _product_to_bigcommerce_modern_rows(
             rows.append(variant_row)
 
     product_images = utils.ordered_unique(
-        [
-            url
-            for url in (
-                _normalize_image_url(image) for image in utils.resolve_product_image_urls(product)
-            )
-            if url
-        ]
+        map(_normalize_image_url, utils.resolve_product_image_urls(product))
     )
     for image_index, image_url in enumerate(product_images, start=1):
         image_row = _empty_row()
@@ -578,6 +561,7 @@ def product_to_bigcommerce_csv(
     publish: bool | None = None,
     csv_format: BigCommerceCsvFormat = "modern",
     weight_unit: str = "kg",
+    now: datetime | None = None,
 ) -> tuple[str, str]:
     rows = product_to_bigcommerce_rows(
         product,
@@ -586,4 +570,4 @@ def product_to_bigcommerce_csv(
         weight_unit=weight_unit,
     )
     columns = BIGCOMMERCE_COLUMNS if csv_format == "modern" else BIGCOMMERCE_LEGACY_COLUMNS
-    return utils.dict_rows_to_csv(rows, columns), utils.make_export_filename("bigcommerce")
+    return utils.dict_rows_to_csv(rows, columns), utils.make_export_filename("bigcommerce", now=now)
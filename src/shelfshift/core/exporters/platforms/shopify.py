@@ -1,14 +1,13 @@
-import re
+from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse
 
-from slugify import slugify
-
 from ...canonical import Product, Variant
 from ...csv_schemas.shopify import SHOPIFY_COLUMNS
 from ..shared import utils
 from ..shared.weight_units import resolve_weight_unit
 
-_HANDLE_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_BOOL_TEXT = ("FALSE", "TRUE")
 _SHOPIFY_SUPPORTED_IMAGE_EXTENSIONS = (".gif", ".jpeg", ".jpg", ".png", ".webp", ".heic")
 # Fallback used only when a non-empty source image URL is not Shopify-compatible.
 SHOPIFY_DEFAULT_IMAGE_URL = (
@@ -54,68 +53,51 @@ _SHOPIFY_CANONICAL_HEADERS: set[str] = utils.infer_export_canonical_headers(
 )
 
 
-def _set_cell(row: dict[str, str], header: str, value: str) -> None:
-    if header not in row:
-        raise ValueError(f"Unknown Shopify header assignment: {header}")
-    row[header] = value
-
-
-def _empty_row() -> dict[str, str]:
-    return dict.fromkeys(SHOPIFY_COLUMNS, "")
-
-
-def _format_bool(value: bool) -> str:
-    return "TRUE" if value else "FALSE"
-
-
-def _format_grams(value: float | None) -> str:
-    if value is None:
-        return ""
-    return str(max(0, round(value)))
-
-
-def _format_inventory_qty(value: int | None) -> str:
-    if value is None:
-        return ""
-    try:
-        return str(max(0, int(value)))
-    except (TypeError, ValueError):
-        return ""
-
-
-def _normalize_handle(value: str) -> str:
-    normalized = value.strip().lower()
-    if _HANDLE_RE.fullmatch(normalized):
-        return normalized
-    return ""
-
-
-def _resolve_handle(product: Product) -> str:
-    if product.source.slug:
-        handle = _normalize_handle(product.source.slug)
-        if handle:
-            return handle
-
-    if product.title:
-        title_handle = _normalize_handle(slugify(product.title))
-        if title_handle:
-            return title_handle
-
-    fallback = slugify(f"{product.source.platform or 'product'}-{product.source.id or 'item'}")
-    handle = _normalize_handle(fallback)
-    return handle or "product-item"
+_COLUMN_INDEX: dict[str, int] = {header: index for index, header in enumerate(SHOPIFY_COLUMNS)}
+_ROW_WIDTH = len(SHOPIFY_COLUMNS)
+_COL_TITLE = _COLUMN_INDEX[H.title]
+_COL_URL_HANDLE = _COLUMN_INDEX[H.url_handle]
+_COL_DESCRIPTION = _COLUMN_INDEX[H.description]
+_COL_VENDOR = _COLUMN_INDEX[H.vendor]
+_COL_PRODUCT_CATEGORY = _COLUMN_INDEX[H.product_category]
+_COL_TYPE = _COLUMN_INDEX[H.type]
+_COL_TAGS = _COLUMN_INDEX[H.tags]
+_COL_PUBLISHED = _COLUMN_INDEX[H.published_on_online_store]
+_COL_STATUS = _COLUMN_INDEX[H.status]
+_COL_SKU = _COLUMN_INDEX[H.sku]
+_COL_PRICE = _COLUMN_INDEX[H.price]
+_COL_CHARGE_TAX = _COLUMN_INDEX[H.charge_tax]
+_COL_INVENTORY_TRACKER = _COLUMN_INDEX[H.inventory_tracker]
+_COL_INVENTORY_QUANTITY = _COLUMN_INDEX[H.inventory_quantity]
+_COL_CONTINUE_SELLING = _COLUMN_INDEX[H.continue_selling]
+_COL_WEIGHT_GRAMS = _COLUMN_INDEX[H.weight_grams]
+_COL_WEIGHT_UNIT = _COLUMN_INDEX[H.weight_unit]
+_COL_REQUIRES_SHIPPING = _COLUMN_INDEX[H.requires_shipping]
+_COL_FULFILLMENT_SERVICE = _COLUMN_INDEX[H.fulfillment_service]
+_COL_PRODUCT_IMAGE_URL = _COLUMN_INDEX[H.product_image_url]
+_COL_IMAGE_POSITION = _COLUMN_INDEX[H.image_position]
+_COL_IMAGE_ALT_TEXT = _COLUMN_INDEX[H.image_alt_text]
+_COL_VARIANT_IMAGE_URL = _COLUMN_INDEX[H.variant_image_url]
+_COL_GIFT_CARD = _COLUMN_INDEX[H.gift_card]
+_COL_SEO_TITLE = _COLUMN_INDEX[H.seo_title]
+_COL_SEO_DESCRIPTION = _COLUMN_INDEX[H.seo_description]
+_COL_OPTION_NAMES = tuple(_COLUMN_INDEX[f"Option{i} name"] for i in range(1, 4))
+_COL_OPTION_VALUES = tuple(_COLUMN_INDEX[f"Option{i} value"] for i in range(1, 4))
+
+
+def _empty_row() -> list[str]:
+    return [""] * _ROW_WIDTH
 
 
 def _resolve_option_names(product: Product) -> list[str]:
-    option_names = [option.name for option in utils.resolve_option_defs(product) if option.name]
+    option_names = utils.resolve_option_names(product, limit=3)
     if not option_names:
         return ["Title"]
-    return option_names[:3]
+    return option_names
 
 
 def _resolve_tags(product: Product) -> str:
-    tags = sorted(utils.ordered_unique(product.tags or []), key=str.lower)
-    return ",".join(tags)
+    return ",".join(utils.tidy_tags(product))
 
 
 def _resolve_type(product: Product) -> str:
@@ -130,6 +112,8 @@ def _resolve_price(product: Product, variant: Variant) -> str:
     return utils.format_number(amount, decimals=2) if amount is not None else ""
 
 
+# Batch exports revisit the same CDN URLs across variants and products.
+@lru_cache(maxsize=4096)
 def _is_valid_shopify_image_url(value: str) -> bool:
     parsed = urlparse(value)
     if parsed.scheme not in {"http", "https"} or not parsed.netloc:
@@ -150,92 +134,98 @@ def _resolve_shopify_image_url(value: str | None) -> str:
 
 
 def _resolve_shopify_product_images(images: list[str] | None) -> list[str]:
-    resolved = [_resolve_shopify_image_url(value) for value in (images or [])]
-    non_empty = [value for value in resolved if value]
-    return utils.ordered_unique(non_empty)
+    if not images:
+        return []
+    if len(images) == 1:
+        single = _resolve_shopify_image_url(images[0])
+        return [single] if single else []
+    # ordered_unique already drops the empty results of unusable URLs.
+    return utils.ordered_unique(_resolve_shopify_image_url(value) for value in images)
 
 
-def product_to_shopify_rows(
+def product_to_shopify_list_rows(
     product: Product,
     *,
     publish: bool | None = None,
     weight_unit: str = "g",
-) -> list[dict[str, str]]:
+) -> list[list[str]]:
+    # Positional rows in SHOPIFY_COLUMNS order; the CSV writers consume these directly.
     resolved_weight_unit = resolve_weight_unit("shopify", weight_unit)
     is_visible = utils.resolve_product_visibility(product, publish_override=publish)
-    handle = _resolve_handle(product)
+    handle = utils.resolve_product_handle(product)
     option_names = _resolve_option_names(product)
     image_alt_text = (product.title or "").strip()
     product_images = _resolve_shopify_product_images(utils.resolve_product_image_urls(product))
-    rows: list[dict[str, str]] = []
+    rows: list[list[str]] = []
     variants = utils.resolve_variants(product)
+    requires_shipping = _BOOL_TEXT[bool(product.requires_shipping and not product.is_digital)]
+    charge_tax = _BOOL_TEXT[not product.is_digital]
+    product_option_names = [option.name for option in utils.resolve_option_defs(product)]
 
     for index, variant in enumerate(variants):
         row = _empty_row()
-        variant_option_values = utils.resolve_variant_option_map(product, variant)
-        _set_cell(row, H.url_handle, handle)
-        _set_cell(row, H.sku, str(variant.sku or variant.id or ""))
-        _set_cell(row, H.price, _resolve_price(product, variant))
-        _set_cell(row, H.continue_selling, "FALSE")
-        _set_cell(row, H.fulfillment_service, "manual")
-        _set_cell(
-            row,
-            H.requires_shipping,
-            _format_bool(bool(product.requires_shipping and not product.is_digital)),
+        variant_option_values = utils.resolve_variant_option_map(
+            product, variant, option_names=product_option_names
         )
-        _set_cell(row, H.charge_tax, _format_bool(not product.is_digital))
-        _set_cell(
-            row,
-            H.variant_image_url,
-            _resolve_shopify_image_url(utils.resolve_variant_image_url(variant)),
+        row[_COL_URL_HANDLE] = handle
+        row[_COL_SKU] = str(variant.sku or variant.id or "")
+        row[_COL_PRICE] = _resolve_price(product, variant)
+        row[_COL_CONTINUE_SELLING] = "FALSE"
+        row[_COL_FULFILLMENT_SERVICE] = "manual"
+        row[_COL_REQUIRES_SHIPPING] = requires_shipping
+        row[_COL_CHARGE_TAX] = charge_tax
+        row[_COL_VARIANT_IMAGE_URL] = _resolve_shopify_image_url(
+            utils.resolve_variant_image_url(variant)
         )
-        _set_cell(row, H.gift_card, "FALSE")
+        row[_COL_GIFT_CARD] = "FALSE"
 
-        grams = _format_grams(utils.resolve_weight_grams(product, variant))
-        if grams:
-            _set_cell(row, H.weight_grams, grams)
-            _set_cell(row, H.weight_unit, resolved_weight_unit)
+        grams = utils.resolve_weight_grams(product, variant)
+        if grams is not None:
+            row[_COL_WEIGHT_GRAMS] = str(max(0, round(grams)))
+            row[_COL_WEIGHT_UNIT] = resolved_weight_unit
 
-        qty = _format_inventory_qty(utils.resolve_variant_inventory_quantity(variant))
-        if qty:
-            _set_cell(row, H.inventory_tracker, "shopify")
-            _set_cell(row, H.inventory_quantity, qty)
+        qty = utils.resolve_variant_inventory_quantity(variant)
+        if qty is not None:
+            row[_COL_INVENTORY_TRACKER] = "shopify"
+            row[_COL_INVENTORY_QUANTITY] = str(qty)
 
-        for option_index, option_name in enumerate(option_names, start=1):
+        for option_slot, option_name in enumerate(option_names):
             option_value = ""
             if option_name == "Title" and not variant_option_values:
                 option_value = "Default Title"
             else:
                 option_value = str(variant_option_values.get(option_name) or "")
-            _set_cell(row, f"Option{option_index} name", option_name)
-            _set_cell(row, f"Option{option_index} value", option_value)
+            row[_COL_OPTION_NAMES[option_slot]] = option_name
+            row[_COL_OPTION_VALUES[option_slot]] = option_value
 
         if index == 0:
-            _set_cell(row, H.title, product.title or "")
-            _set_cell(row, H.description, product.description or "")
-            _set_cell(row, H.vendor, product.vendor or product.brand or "")
-            _set_cell(row, H.product_category, utils.resolve_primary_category(product))
-            _set_cell(row, H.type, _resolve_type(product))
-            _set_cell(row, H.tags, _resolve_tags(product))
-            _set_cell(row, H.published_on_online_store, _format_bool(is_visible))
-            _set_cell(row, H.status, "Active" if is_visible else "Draft")
-            _set_cell(row, H.seo_title, utils.resolve_seo_title(product))
-            _set_cell(row, H.seo_description, utils.resolve_seo_description(product))
+            row[_COL_TITLE] = product.title or ""
+            row[_COL_DESCRIPTION] = product.description or ""
+            row[_COL_VENDOR] = product.vendor or product.brand or ""
+            row[_COL_PRODUCT_CATEGORY] = utils.resolve_primary_category(product)
+            row[_COL_TYPE] = _resolve_type(product)
+            row[_COL_TAGS] = _resolve_tags(product)
+            row[_COL_PUBLISHED] = _BOOL_TEXT[is_visible]
+            row[_COL_STATUS] = "Active" if is_visible else "Draft"
+            row[_COL_SEO_TITLE] = utils.resolve_seo_title(product)
+            row[_COL_SEO_DESCRIPTION] = utils.resolve_seo_description(product)
             if product_images:
-                _set_cell(row, H.product_image_url, product_images[0])
-                _set_cell(row, H.image_position, "1")
-                _set_cell(row, H.image_alt_text, image_alt_text)
-            utils.apply_platform_unmapped_fields_to_row(
+                row[_COL_PRODUCT_IMAGE_URL] = product_images[0]
+                row[_COL_IMAGE_POSITION] = "1"
+                row[_COL_IMAGE_ALT_TEXT] = image_alt_text
+            utils.apply_platform_unmapped_fields_to_list_row(
                 row,
                 product,
                 platform="shopify",
                 canonical_headers=_SHOPIFY_CANONICAL_HEADERS,
+                column_index=_COLUMN_INDEX,
             )
-        utils.apply_platform_unmapped_fields_to_row(
+        utils.apply_platform_unmapped_fields_to_list_row(
             row,
             product,
             platform="shopify",
             canonical_headers=_SHOPIFY_CANONICAL_HEADERS,
+            column_index=_COLUMN_INDEX,
             variant=variant,
         )
 
@@ -243,20 +233,35 @@ def product_to_shopify_rows(
 
     for image_position, image_url in enumerate(product_images[1:], start=2):
         row = _empty_row()
-        _set_cell(row, H.url_handle, handle)
-        _set_cell(row, H.product_image_url, image_url)
-        _set_cell(row, H.image_position, str(image_position))
-        _set_cell(row, H.image_alt_text, image_alt_text)
+        row[_COL_URL_HANDLE] = handle
+        row[_COL_PRODUCT_IMAGE_URL] = image_url
+        row[_COL_IMAGE_POSITION] = str(image_position)
+        row[_COL_IMAGE_ALT_TEXT] = image_alt_text
         rows.append(row)
 
     return rows
 
 
+def product_to_shopify_rows(
+    product: Product,
+    *,
+    publish: bool | None = None,
+    weight_unit: str = "g",
+) -> list[dict[str, str]]:
+    return [
+        dict(zip(SHOPIFY_COLUMNS, row, strict=True))
+        for row in product_to_shopify_list_rows(product, publish=publish, weight_unit=weight_unit)
+    ]
+
+
 def product_to_shopify_csv(
     product: Product,
     *,
     publish: bool | None = None,
     weight_unit: str = "g",
+    now: datetime | None = None,
 ) -> tuple[str, str]:
-    rows = product_to_shopify_rows(product, publish=publish, weight_unit=weight_unit)
-    return utils.dict_rows_to_csv(rows, SHOPIFY_COLUMNS), utils.make_export_filename("shopify")
+    rows = product_to_shopify_list_rows(product, publish=publish, weight_unit=weight_unit)
+    return utils.list_rows_to_csv(rows, SHOPIFY_COLUMNS), utils.make_export_filename(
+        "shopify", now=now
+    )
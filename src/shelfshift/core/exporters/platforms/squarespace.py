@@ -1,8 +1,17 @@
+from datetime import datetime
+
 from ...canonical import Product, Variant
 from ...csv_schemas.squarespace import SQUARESPACE_COLUMNS
 from ..shared import utils
 from ..shared.weight_units import resolve_weight_unit
 
+_BOOL_TEXT = ("No", "Yes")
+_MAX_OPTIONS = 6
+# (name header, value header) per option slot; every slot exists in the schema.
+_OPTION_HEADERS = tuple(
+    (f"Option Name {i}", f"Option Value {i}") for i in range(1, _MAX_OPTIONS + 1)
+)
+
 
 class _SquarespaceExportHeaders:
     product_type = "Product Type [Non Editable]"
@@ -25,7 +34,7 @@ class _SquarespaceExportHeaders:
 H = _SquarespaceExportHeaders()
 _SQUARESPACE_CANONICAL_HEADERS: set[str] = utils.infer_export_canonical_headers(
     export_headers=H,
-    indexed_header_families=[(("Option Name {i}", "Option Value {i}"), range(1, 7))],
+    indexed_header_families=[(("Option Name {i}", "Option Value {i}"), range(1, _MAX_OPTIONS + 1))],
 )
 
 
@@ -35,19 +44,18 @@ def _set_cell(row: dict[str, str], header: str, value: str) -> None:
     row[header] = value
 
 
-def _empty_row() -> dict[str, str]:
-    return dict.fromkeys(SQUARESPACE_COLUMNS, "")
+_EMPTY_ROW_TEMPLATE: dict[str, str] = dict.fromkeys(SQUARESPACE_COLUMNS, "")
 
 
-def _format_bool(value: bool) -> str:
-    return "Yes" if value else "No"
+def _empty_row() -> dict[str, str]:
+    return _EMPTY_ROW_TEMPLATE.copy()
 
 
 def _resolve_option_names(product: Product, variants: list[Variant]) -> list[str]:
-    option_names = [option.name for option in utils.resolve_option_defs(product) if option.name]
+    option_names = utils.resolve_option_names(product, limit=_MAX_OPTIONS)
     if not option_names and len(variants) > 1:
         return ["Option"]
-    return option_names[:6]
+    return option_names
 
 
 def _resolve_price(product: Product, variant: Variant) -> str:
@@ -73,18 +81,13 @@ def _resolve_weight(product: Product, variant: Variant, *, weight_unit: str) ->
 
 
 def _resolve_tags(product: Product) -> str:
-    tags = sorted(utils.ordered_unique(product.tags or []), key=str.lower)
-    return ",".join(tags)
+    return ",".join(utils.tidy_tags(product))
 
 
 def _resolve_hosted_image_urls(product: Product) -> str:
     return "\n".join(utils.resolve_product_image_urls(product))
 
 
-def _fallback_option_value(variant: Variant, index: int) -> str:
-    return str(variant.title or variant.sku or variant.id or f"Variant {index}")
-
-
 def _set_variant_option_fields(
     row: dict[str, str],
     option_names: list[str],
@@ -93,12 +96,13 @@ def _set_variant_option_fields(
     index: int,
     values_by_name: dict[str, str],
 ) -> None:
-    for option_index, option_name in enumerate(option_names, start=1):
-        _set_cell(row, f"Option Name {option_index}", option_name)
+    for slot, option_name in enumerate(option_names):
+        name_header, value_header = _OPTION_HEADERS[slot]
+        row[name_header] = option_name
         if option_name == "Option":
-            _set_cell(row, f"Option Value {option_index}", _fallback_option_value(variant, index))
-            continue
-        _set_cell(row, f"Option Value {option_index}", str(values_by_name.get(option_name) or ""))
+            row[value_header] = utils.fallback_option_value(variant, index)
+        else:
+            row[value_header] = str(values_by_name.get(option_name) or "")
 
 
 def product_to_squarespace_rows(
@@ -114,11 +118,14 @@ def product_to_squarespace_rows(
     variants = utils.resolve_variants(product)
     option_names = _resolve_option_names(product, variants)
     hosted_image_urls = _resolve_hosted_image_urls(product)
+    product_option_names = [option.name for option in utils.resolve_option_defs(product)]
 
     rows: list[dict[str, str]] = []
     for index, variant in enumerate(variants, start=1):
         row = _empty_row()
-        variant_option_values = utils.resolve_variant_option_map(product, variant)
+        variant_option_values = utils.resolve_variant_option_map(
+            product, variant, option_names=product_option_names
+        )
         _set_cell(row, H.sku, str(variant.sku or variant.id or ""))
         _set_cell(row, H.price, _resolve_price(product, variant))
         _set_cell(row, H.sale_price, "")
@@ -146,7 +153,7 @@ def product_to_squarespace_rows(
             _set_cell(
                 row, H.weight, _resolve_weight(product, variant, weight_unit=resolved_weight_unit)
             )
-            _set_cell(row, H.visible, _format_bool(is_visible))
+            _set_cell(row, H.visible, _BOOL_TEXT[is_visible])
             _set_cell(row, H.hosted_image_urls, hosted_image_urls)
             utils.apply_platform_unmapped_fields_to_row(
                 row,
@@ -175,6 +182,7 @@ def product_to_squarespace_csv(
     product_page: str = "",
     product_url: str = "",
     weight_unit: str = "kg",
+    now: datetime | None = None,
 ) -> tuple[str, str]:
     rows = product_to_squarespace_rows(
         product,
@@ -184,5 +192,5 @@ def product_to_squarespace_csv(
         weight_unit=weight_unit,
     )
     return utils.dict_rows_to_csv(rows, SQUARESPACE_COLUMNS), utils.make_export_filename(
-        "squarespace"
+        "squarespace", now=now
     )
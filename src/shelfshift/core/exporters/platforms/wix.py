@@ -1,17 +1,15 @@
-import re
-
-from slugify import slugify
+from datetime import datetime
 
 from ...canonical import Product, Variant
 from ...csv_schemas.wix import WIX_COLUMNS
 from ..shared import utils
 from ..shared.weight_units import resolve_weight_unit
 
-_HANDLE_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 _MAX_OPTIONS = 6
 _DEFAULT_OPTION_TYPE = "TEXT_CHOICES"
 _MAX_WIX_NAME_LEN = 80
 _MAX_WIX_PLAIN_DESCRIPTION_LEN = 16000
+_BOOL_TEXT = ("FALSE", "TRUE")
 
 
 class _WixExportHeaders:
@@ -37,18 +35,33 @@ _WIX_CANONICAL_HEADERS: set[str] = utils.infer_export_canonical_headers(
 )
 
 
-def _set_cell(row: dict[str, str], header: str, value: str) -> None:
-    if header not in row:
-        raise ValueError(f"Unknown Wix header assignment: {header}")
-    row[header] = value
-
-
-def _empty_row() -> dict[str, str]:
-    return dict.fromkeys(WIX_COLUMNS, "")
+_COLUMN_INDEX: dict[str, int] = {header: index for index, header in enumerate(WIX_COLUMNS)}
+_ROW_WIDTH = len(WIX_COLUMNS)
+_COL_HANDLE = _COLUMN_INDEX[H.handle]
+_COL_FIELD_TYPE = _COLUMN_INDEX[H.field_type]
+_COL_NAME = _COLUMN_INDEX[H.name]
+_COL_VISIBLE = _COLUMN_INDEX[H.visible]
+_COL_PLAIN_DESCRIPTION = _COLUMN_INDEX[H.plain_description]
+_COL_MEDIA = _COLUMN_INDEX[H.media]
+_COL_MEDIA_ALT_TEXT = _COLUMN_INDEX[H.media_alt_text]
+_COL_BRAND = _COLUMN_INDEX[H.brand]
+_COL_PRICE = _COLUMN_INDEX[H.price]
+_COL_INVENTORY = _COLUMN_INDEX[H.inventory]
+_COL_SKU = _COLUMN_INDEX[H.sku]
+_COL_WEIGHT = _COLUMN_INDEX[H.weight]
+_COL_OPTION_NAMES = tuple(
+    _COLUMN_INDEX[f"productOptionName{i}"] for i in range(1, _MAX_OPTIONS + 1)
+)
+_COL_OPTION_TYPES = tuple(
+    _COLUMN_INDEX[f"productOptionType{i}"] for i in range(1, _MAX_OPTIONS + 1)
+)
+_COL_OPTION_CHOICES = tuple(
+    _COLUMN_INDEX[f"productOptionChoices{i}"] for i in range(1, _MAX_OPTIONS + 1)
+)
 
 
-def _format_bool(value: bool) -> str:
-    return "TRUE" if value else "FALSE"
+def _empty_row() -> list[str]:
+    return [""] * _ROW_WIDTH
 
 
 def _format_inventory_qty(value: int | None) -> str:
@@ -64,6 +77,14 @@ def _truncate(value: str | None, max_len: int) -> str:
     text = str(value or "")
     if not text:
         return ""
+    if text.isascii():
+        return text[:max_len]
+    # Even if every character were astral, short text fits within the limit.
+    if len(text) * 2 <= max_len:
+        return text
+    # Without astral characters, code points and UTF-16 units line up one-to-one.
+    if max(map(ord, text)) <= 0xFFFF:
+        return text[:max_len]
 
     units = 0
     out: list[str] = []
@@ -77,29 +98,6 @@ def _truncate(value: str | None, max_len: int) -> str:
     return "".join(out)
 
 
-def _normalize_handle(value: str) -> str:
-    normalized = value.strip().lower()
-    if _HANDLE_RE.fullmatch(normalized):
-        return normalized
-    return ""
-
-
-def _resolve_handle(product: Product) -> str:
-    if product.source.slug:
-        handle = _normalize_handle(product.source.slug)
-        if handle:
-            return handle
-
-    if product.title:
-        title_handle = _normalize_handle(slugify(product.title))
-        if title_handle:
-            return title_handle
-
-    fallback = slugify(f"{product.source.platform or 'product'}-{product.source.id or 'item'}")
-    handle = _normalize_handle(fallback)
-    return handle or "product-item"
-
-
 def _resolve_price(product: Product, variant: Variant | None = None) -> str:
     amount = utils.resolve_price_amount(product, variant)
     return utils.format_number(amount, decimals=2) if amount is not None else ""
@@ -114,14 +112,10 @@ def _resolve_weight(product: Product, variant: Variant | None = None, *, weight_
 
 
 def _resolve_option_names(product: Product, variants: list[Variant]) -> list[str]:
-    option_names = [option.name for option in utils.resolve_option_defs(product) if option.name]
+    option_names = utils.resolve_option_names(product, limit=_MAX_OPTIONS)
     if not option_names and len(variants) > 1:
         return ["Option"]
-    return option_names[:_MAX_OPTIONS]
-
-
-def _fallback_option_value(variant: Variant, index: int) -> str:
-    return str(variant.title or variant.sku or variant.id or f"Variant {index}")
+    return option_names
 
 
 def _resolve_product_option_choices(
@@ -137,63 +131,49 @@ def _resolve_product_option_choices(
 
     for index, variant in enumerate(variants, start=1):
         if option_name == "Option":
-            values.append(_fallback_option_value(variant, index))
+            values.append(utils.fallback_option_value(variant, index))
             continue
         value = str(variant_option_maps[index - 1].get(option_name) or "")
         if value:
             values.append(value)
 
-    return ";".join(utils.ordered_unique(values))
+    return utils.join_unique(values, ";")
 
 
-def _resolve_variant_option_choice(
-    option_name: str,
-    variant: Variant,
-    *,
-    index: int,
-    values_by_name: dict[str, str],
-) -> str:
-    if option_name == "Option":
-        return _fallback_option_value(variant, index)
-    return str(values_by_name.get(option_name) or "")
-
-
-def _set_option_fields(
-    row: dict[str, str],
+def _set_product_option_fields(
+    row: list[str],
     option_names: list[str],
     variants: list[Variant],
     variant_option_maps: list[dict[str, str]],
     option_values_by_name: dict[str, list[str]],
+) -> None:
+    for option_slot, option_name in enumerate(option_names):
+        row[_COL_OPTION_NAMES[option_slot]] = option_name
+        row[_COL_OPTION_TYPES[option_slot]] = _DEFAULT_OPTION_TYPE
+        row[_COL_OPTION_CHOICES[option_slot]] = _resolve_product_option_choices(
+            variants=variants,
+            variant_option_maps=variant_option_maps,
+            option_values_by_name=option_values_by_name,
+            option_name=option_name,
+        )
+
+
+def _set_variant_option_fields(
+    row: list[str],
+    option_names: list[str],
+    variant: Variant,
+    variant_option_values: dict[str, str],
     *,
-    variant: Variant | None,
-    variant_option_values: dict[str, str] | None,
     index: int,
 ) -> None:
-    for option_index, option_name in enumerate(option_names, start=1):
-        _set_cell(row, f"productOptionName{option_index}", option_name)
-        _set_cell(row, f"productOptionType{option_index}", _DEFAULT_OPTION_TYPE)
-        if variant is None:
-            _set_cell(
-                row,
-                f"productOptionChoices{option_index}",
-                _resolve_product_option_choices(
-                    variants=variants,
-                    variant_option_maps=variant_option_maps,
-                    option_values_by_name=option_values_by_name,
-                    option_name=option_name,
-                ),
-            )
+    for option_slot, option_name in enumerate(option_names):
+        row[_COL_OPTION_NAMES[option_slot]] = option_name
+        row[_COL_OPTION_TYPES[option_slot]] = _DEFAULT_OPTION_TYPE
+        if option_name == "Option":
+            choice = utils.fallback_option_value(variant, index)
         else:
-            _set_cell(
-                row,
-                f"productOptionChoices{option_index}",
-                _resolve_variant_option_choice(
-                    option_name,
-                    variant,
-                    index=index,
-                    values_by_name=variant_option_values or {},
-                ),
-            )
+            choice = str(variant_option_values.get(option_name) or "")
+        row[_COL_OPTION_CHOICES[option_slot]] = choice
 
 
 def _variant_in_stock(product: Product, variant: Variant) -> bool:
@@ -237,125 +217,137 @@ def _resolve_product_inventory(product: Product, variants: list[Variant]) -> str
     return "OUT_OF_STOCK"
 
 
-def product_to_wix_rows(
+def product_to_wix_list_rows(
     product: Product,
     *,
     publish: bool | None = None,
     weight_unit: str = "kg",
-) -> list[dict[str, str]]:
+) -> list[list[str]]:
+    # Positional rows in WIX_COLUMNS order; the CSV writers consume these directly.
     resolved_weight_unit = resolve_weight_unit("wix", weight_unit)
     is_visible = utils.resolve_product_visibility(product, publish_override=publish)
-    handle = _resolve_handle(product)
+    handle = utils.resolve_product_handle(product)
     variants = utils.resolve_variants(product)
     images = utils.resolve_product_image_urls(product)
     option_names = _resolve_option_names(product, variants)
+    option_defs = utils.resolve_option_defs(product)
+    product_option_names = [option.name for option in option_defs]
     option_values_by_name = {
         option.name: option.values
-        for option in utils.resolve_option_defs(product)
+        for option in option_defs
         if option.name and option.name in option_names
     }
     variant_option_maps = [
-        utils.resolve_variant_option_map(product, variant) for variant in variants
+        utils.resolve_variant_option_map(product, variant, option_names=product_option_names)
+        for variant in variants
     ]
 
-    rows: list[dict[str, str]] = []
+    rows: list[list[str]] = []
+    # Variants without their own price/weight fall back to these product-level values.
+    product_price = _resolve_price(product)
+    product_weight = _resolve_weight(product, weight_unit=resolved_weight_unit)
 
     first_variant = variants[0] if variants else None
     product_row = _empty_row()
-    _set_cell(product_row, H.handle, handle)
-    _set_cell(product_row, H.field_type, "PRODUCT")
-    _set_cell(product_row, H.name, _truncate(product.title, _MAX_WIX_NAME_LEN))
-    _set_cell(product_row, H.visible, _format_bool(is_visible))
-    _set_cell(
-        product_row,
-        H.plain_description,
-        _truncate(product.description, _MAX_WIX_PLAIN_DESCRIPTION_LEN),
+    product_row[_COL_HANDLE] = handle
+    product_row[_COL_FIELD_TYPE] = "PRODUCT"
+    product_row[_COL_NAME] = _truncate(product.title, _MAX_WIX_NAME_LEN)
+    product_row[_COL_VISIBLE] = _BOOL_TEXT[is_visible]
+    product_row[_COL_PLAIN_DESCRIPTION] = _truncate(
+        product.description, _MAX_WIX_PLAIN_DESCRIPTION_LEN
     )
-    _set_cell(product_row, H.brand, product.vendor or product.brand or "")
-    _set_cell(product_row, H.price, _resolve_price(product, first_variant))
-    _set_cell(product_row, H.inventory, _resolve_product_inventory(product, variants))
-    _set_cell(
-        product_row,
-        H.sku,
-        str((first_variant.sku if first_variant else None) or product.source.id or ""),
+    product_row[_COL_BRAND] = product.vendor or product.brand or ""
+    product_row[_COL_PRICE] = _resolve_price(product, first_variant)
+    product_row[_COL_INVENTORY] = _resolve_product_inventory(product, variants)
+    product_row[_COL_SKU] = str(
+        (first_variant.sku if first_variant else None) or product.source.id or ""
     )
-    _set_cell(
-        product_row,
-        H.weight,
-        _resolve_weight(product, first_variant, weight_unit=resolved_weight_unit),
+    product_row[_COL_WEIGHT] = _resolve_weight(
+        product, first_variant, weight_unit=resolved_weight_unit
     )
+    media_alt_text = (product.title or "").strip()
     if images:
-        _set_cell(product_row, H.media, images[0])
-        _set_cell(product_row, H.media_alt_text, (product.title or "").strip())
+        product_row[_COL_MEDIA] = images[0]
+        product_row[_COL_MEDIA_ALT_TEXT] = media_alt_text
 
-    _set_option_fields(
+    _set_product_option_fields(
         product_row,
         option_names,
         variants,
         variant_option_maps,
         option_values_by_name,
-        variant=None,
-        variant_option_values=None,
-        index=0,
     )
-    utils.apply_platform_unmapped_fields_to_row(
+    utils.apply_platform_unmapped_fields_to_list_row(
         product_row,
         product,
         platform="wix",
         canonical_headers=_WIX_CANONICAL_HEADERS,
+        column_index=_COLUMN_INDEX,
     )
     rows.append(product_row)
 
     for index, variant in enumerate(variants, start=1):
-        variant_option_values = variant_option_maps[index - 1]
         variant_row = _empty_row()
-        _set_cell(variant_row, H.handle, handle)
-        _set_cell(variant_row, H.field_type, "VARIANT")
-        _set_cell(variant_row, H.visible, _format_bool(is_visible))
-        _set_cell(variant_row, H.price, _resolve_price(product, variant))
-        _set_cell(variant_row, H.inventory, _resolve_variant_inventory(product, variant))
-        _set_cell(variant_row, H.sku, str(variant.sku or variant.id or ""))
-        _set_cell(
-            variant_row,
-            H.weight,
-            _resolve_weight(product, variant, weight_unit=resolved_weight_unit),
+        variant_row[_COL_HANDLE] = handle
+        variant_row[_COL_FIELD_TYPE] = "VARIANT"
+        variant_row[_COL_VISIBLE] = _BOOL_TEXT[is_visible]
+        variant_row[_COL_PRICE] = (
+            _resolve_price(product, variant) if variant.price else product_price
+        )
+        variant_row[_COL_INVENTORY] = _resolve_variant_inventory(product, variant)
+        variant_row[_COL_SKU] = str(variant.sku or variant.id or "")
+        variant_row[_COL_WEIGHT] = (
+            _resolve_weight(product, variant, weight_unit=resolved_weight_unit)
+            if variant.weight is not None
+            else product_weight
         )
 
-        _set_option_fields(
+        _set_variant_option_fields(
             variant_row,
             option_names,
-            variants,
-            variant_option_maps,
-            option_values_by_name,
-            variant=variant,
-            variant_option_values=variant_option_values,
+            variant,
+            variant_option_maps[index - 1],
             index=index,
         )
-        utils.apply_platform_unmapped_fields_to_row(
+        utils.apply_platform_unmapped_fields_to_list_row(
             variant_row,
             product,
             platform="wix",
             canonical_headers=_WIX_CANONICAL_HEADERS,
+            column_index=_COLUMN_INDEX,
             variant=variant,
         )
         rows.append(variant_row)
 
     for image_url in images[1:]:
         media_row = _empty_row()
-        _set_cell(media_row, H.handle, handle)
-        _set_cell(media_row, H.field_type, "MEDIA")
-        _set_cell(media_row, H.media, image_url)
-        _set_cell(media_row, H.media_alt_text, (product.title or "").strip())
+        media_row[_COL_HANDLE] = handle
+        media_row[_COL_FIELD_TYPE] = "MEDIA"
+        media_row[_COL_MEDIA] = image_url
+        media_row[_COL_MEDIA_ALT_TEXT] = media_alt_text
         rows.append(media_row)
 
     return rows
 
 
+def product_to_wix_rows(
+    product: Product,
+    *,
+    publish: bool | None = None,
+    weight_unit: str = "kg",
+) -> list[dict[str, str]]:
+    return [
+        dict(zip(WIX_COLUMNS, row, strict=True))
+        for row in product_to_wix_list_rows(product, publish=publish, weight_unit=weight_unit)
+    ]
+
+
 def product_to_wix_csv(
     product: Product,
     *,
     publish: bool | None = None,
     weight_unit: str = "kg",
+    now: datetime | None = None,
 ) -> tuple[str, str]:
-    rows = product_to_wix_rows(product, publish=publish, weight_unit=weight_unit)
-    return utils.dict_rows_to_csv(rows, WIX_COLUMNS), utils.make_export_filename("wix")
+    rows = product_to_wix_list_rows(product, publish=publish, weight_unit=weight_unit)
+    return utils.list_rows_to_csv(rows, WIX_COLUMNS), utils.make_export_filename("wix", now=now)
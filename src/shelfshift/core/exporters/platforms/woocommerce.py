@@ -1,11 +1,13 @@
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from functools import lru_cache
 
-from slugify import slugify
-
-from ...canonical import Product, Variant
+from ...canonical import OptionDef, Product, Variant
 from ...csv_schemas.woocommerce import (
+    WOOCOMMERCE_COLUMNS,
     WOOCOMMERCE_WEIGHT_HEADER_BY_UNIT,
+    WOOCOMMERCE_WEIGHT_HEADER_PLACEHOLDER,
     woocommerce_columns_for_weight_unit,
 )
 from ..shared import utils
@@ -62,39 +64,97 @@ _PLATFORM_TOKEN = {
     "aliexpress": "AE",
 }
 
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Only match real tags/comments so bare "<" in text (e.g. "5 < 10 > 3") survives.
+_HTML_TAG_RE = re.compile(r"</?[A-Za-z!][^>]*>")
+_MAX_ATTRIBUTES = 3
+
+_ROW_WIDTH = len(WOOCOMMERCE_COLUMNS)
+_COLUMN_INDEX_BY_UNIT: dict[str, dict[str, int]] = {
+    unit: {header: index for index, header in enumerate(woocommerce_columns_for_weight_unit(unit))}
+    for unit in WOOCOMMERCE_WEIGHT_HEADER_BY_UNIT
+}
+_COLUMN_INDEX = _COLUMN_INDEX_BY_UNIT["kg"]
+_COL_TYPE = _COLUMN_INDEX[H.type]
+_COL_SKU = _COLUMN_INDEX[H.sku]
+_COL_NAME = _COLUMN_INDEX[H.name]
+_COL_PUBLISHED = _COLUMN_INDEX[H.published]
+_COL_IS_FEATURED = _COLUMN_INDEX[H.is_featured]
+_COL_VISIBILITY_IN_CATALOG = _COLUMN_INDEX[H.visibility_in_catalog]
+_COL_SHORT_DESCRIPTION = _COLUMN_INDEX[H.short_description]
+_COL_DESCRIPTION = _COLUMN_INDEX[H.description]
+_COL_TAX_STATUS = _COLUMN_INDEX[H.tax_status]
+_COL_IN_STOCK = _COLUMN_INDEX[H.in_stock]
+_COL_STOCK = _COLUMN_INDEX[H.stock]
+_COL_BACKORDERS_ALLOWED = _COLUMN_INDEX[H.backorders_allowed]
+_COL_SOLD_INDIVIDUALLY = _COLUMN_INDEX[H.sold_individually]
+_COL_WEIGHT = WOOCOMMERCE_COLUMNS.index(WOOCOMMERCE_WEIGHT_HEADER_PLACEHOLDER)
+_COL_REGULAR_PRICE = _COLUMN_INDEX[H.regular_price]
+_COL_CATEGORIES = _COLUMN_INDEX[H.categories]
+_COL_TAGS = _COLUMN_INDEX[H.tags]
+_COL_IMAGES = _COLUMN_INDEX[H.images]
+_COL_PARENT = _COLUMN_INDEX[H.parent]
+# Attribute slots the schema actually carries (name, value(s), visible, global).
+_ATTRIBUTE_COLUMNS = tuple(
+    (
+        _COLUMN_INDEX[f"Attribute {i} name"],
+        _COLUMN_INDEX[f"Attribute {i} value(s)"],
+        _COLUMN_INDEX[f"Attribute {i} visible"],
+        _COLUMN_INDEX[f"Attribute {i} global"],
+    )
+    for i in range(1, _MAX_ATTRIBUTES + 1)
+    if f"Attribute {i} name" in _COLUMN_INDEX
+)
 
 
-def _empty_row(columns: list[str]) -> dict[str, str]:
-    return dict.fromkeys(columns, "")
+def _empty_row() -> list[str]:
+    return [""] * _ROW_WIDTH
 
 
-def _set_cell(row: dict[str, str], header: str, value: str) -> None:
-    if header not in row:
-        raise ValueError(f"Unknown WooCommerce header assignment: {header}")
-    row[header] = value
+def _is_plain_ascii_slug(text: str) -> bool:
+    # Already in slugify's output shape: ASCII alphanumerics joined by single dashes.
+    return (
+        text.isascii()
+        and text.replace("-", "").isalnum()
+        and not text.startswith("-")
+        and not text.endswith("-")
+        and "--" not in text
+    )
 
 
 def _slug(value: str | None) -> str:
     if value is None:
         return ""
-    return slugify(str(value).strip(), separator="-")
+    text = str(value).strip()
+    if _is_plain_ascii_slug(text):
+        return text.lower()
+    return utils.cached_slugify(text)
 
 
 def _platform_token(platform: str | None) -> str:
     return _PLATFORM_TOKEN.get((platform or "").strip().lower(), "SRC")
 
 
-def _resolve_product_key(product: Product) -> str:
-    for candidate in (product.source.id, product.source.slug, product.title):
+@lru_cache(maxsize=4096)
+def _parent_sku_for(
+    platform: str | None,
+    source_id: str | None,
+    slug: str | None,
+    title: str | None,
+) -> str:
+    product_key = "item"
+    for candidate in (source_id, slug, title):
         key = _slug(candidate)
         if key:
-            return key
-    return "item"
+            product_key = key
+            break
+    return f"{_platform_token(platform)}:{product_key}"
 
 
 def _resolve_parent_sku(product: Product) -> str:
-    return f"{_platform_token(product.source.platform)}:{_resolve_product_key(product)}"
+    # Re-exports of the same source product skip the slugify candidates entirely.
+    return _parent_sku_for(
+        product.source.platform, product.source.id, product.source.slug, product.title
+    )
 
 
 def _resolve_variant_key(variant: Variant, index: int) -> str:
@@ -105,35 +165,48 @@ def _resolve_variant_key(variant: Variant, index: int) -> str:
     return str(index)
 
 
-def _resolve_option_names(product: Product, variants: list[Variant]) -> list[str]:
-    names = [option.name for option in utils.resolve_option_defs(product) if option.name]
+def _resolve_option_names(option_defs: list[OptionDef], variants: list[Variant]) -> list[str]:
+    names = [option.name for option in option_defs[:_MAX_ATTRIBUTES]]
     if not names and len(variants) > 1:
         return ["Option"]
-    return names[:3]
+    return names
 
 
-def _fallback_option_value(variant: Variant, index: int) -> str:
-    return str(variant.title or variant.sku or variant.id or f"Variant {index}")
+def _resolve_option_columns(
+    product: Product,
+    variants: list[Variant],
+    option_names: list[str],
+    product_option_names: list[str],
+) -> list[list[str]]:
+    # One list per attribute slot, filled in a single pass over the variants.
+    columns: list[list[str]] = [[] for _ in option_names]
+    if not columns:
+        return columns
+    for index, variant in enumerate(variants, start=1):
+        option_map = utils.resolve_variant_option_map(
+            product, variant, option_names=product_option_names
+        )
+        for option_name, column in zip(option_names, columns, strict=True):
+            if option_name == "Option":
+                column.append(utils.fallback_option_value(variant, index))
+            else:
+                column.append(str(option_map.get(option_name) or ""))
+    return columns
 
 
 def _resolve_parent_attribute_values(
-    variants: list[Variant],
     option_names: list[str],
     option_values_by_name: dict[str, list[str]],
-    variant_option_maps: list[dict[str, str]],
-) -> dict[str, list[str]]:
-    values_by_option: dict[str, list[str]] = {}
-    for option_name in option_names:
-        values: list[str] = []
-        if option_name != "Option":
-            values.extend(option_values_by_name.get(option_name, []))
-        for index, variant in enumerate(variants, start=1):
-            if option_name == "Option":
-                values.append(_fallback_option_value(variant, index))
-            else:
-                values.append(str(variant_option_maps[index - 1].get(option_name) or ""))
-        values_by_option[option_name] = utils.ordered_unique(values)
-    return values_by_option
+    option_columns: list[list[str]],
+) -> list[str]:
+    values: list[str] = []
+    for option_name, column in zip(option_names, option_columns, strict=True):
+        if option_name == "Option":
+            values.append(utils.join_unique(column, ","))
+        else:
+            defined = option_values_by_name.get(option_name, [])
+            values.append(utils.join_unique([*defined, *column], ","))
+    return values
 
 
 def _resolve_price(product: Product, variant: Variant | None = None) -> str:
@@ -150,16 +223,17 @@ def _resolve_weight(product: Product, variant: Variant | None = None, *, unit: s
 
 
 def _resolve_tags(product: Product) -> str:
-    tags = sorted(utils.ordered_unique(product.tags or []), key=str.lower)
-    return ",".join(tags)
+    return ",".join(utils.tidy_tags(product))
 
 
 def _resolve_images(images: Iterable[str]) -> str:
-    return ",".join(utils.ordered_unique(str(image) for image in images))
+    return utils.join_unique(images, ",")
 
 
 def _strip_html(text: str | None) -> str:
-    cleaned = _HTML_TAG_RE.sub(" ", text or "")
+    cleaned = text or ""
+    if "<" in cleaned:
+        cleaned = _HTML_TAG_RE.sub(" ", cleaned)
     return " ".join(cleaned.split())
 
 
@@ -170,24 +244,28 @@ def _resolve_short_description(product: Product) -> str:
     return _strip_html(product.description)
 
 
-def _set_common_product_fields(
-    row: dict[str, str],
+def _set_variation_fields(row: list[str], product: Product, *, is_visible: bool) -> None:
+    row[_COL_PUBLISHED] = "1" if is_visible else "0"
+    row[_COL_IS_FEATURED] = "0"
+    row[_COL_VISIBILITY_IN_CATALOG] = "visible" if is_visible else "hidden"
+    row[_COL_TAX_STATUS] = "none" if product.is_digital else "taxable"
+    row[_COL_BACKORDERS_ALLOWED] = "0"
+    row[_COL_SOLD_INDIVIDUALLY] = "0"
+
+
+def _set_parent_fields(
+    row: list[str],
     product: Product,
     *,
     is_visible: bool,
-    include_descriptions: bool = True,
+    categories: str,
+    tags: str,
 ) -> None:
-    _set_cell(row, H.published, "1" if is_visible else "0")
-    _set_cell(row, H.is_featured, "0")
-    _set_cell(row, H.visibility_in_catalog, "visible" if is_visible else "hidden")
-    if include_descriptions:
-        _set_cell(row, H.short_description, _resolve_short_description(product))
-        _set_cell(row, H.description, product.description or "")
-    _set_cell(row, H.tax_status, "none" if product.is_digital else "taxable")
-    _set_cell(row, H.backorders_allowed, "0")
-    _set_cell(row, H.sold_individually, "0")
-    _set_cell(row, H.categories, utils.resolve_primary_category(product))
-    _set_cell(row, H.tags, _resolve_tags(product))
+    _set_variation_fields(row, product, is_visible=is_visible)
+    row[_COL_SHORT_DESCRIPTION] = _resolve_short_description(product)
+    row[_COL_DESCRIPTION] = product.description or ""
+    row[_COL_CATEGORIES] = categories
+    row[_COL_TAGS] = tags
 
 
 def _variant_in_stock(variant: Variant) -> bool:
@@ -200,199 +278,189 @@ def _variant_in_stock(variant: Variant) -> bool:
     return True
 
 
-def _apply_stock_fields(row: dict[str, str], variant: Variant) -> None:
+def _apply_stock_fields(row: list[str], variant: Variant) -> None:
     quantity = utils.resolve_variant_inventory_quantity(variant)
     if quantity is not None:
         qty = max(0, quantity)
-        _set_cell(row, H.stock, str(qty))
-        _set_cell(row, H.in_stock, "1" if qty > 0 else "0")
+        row[_COL_STOCK] = str(qty)
+        row[_COL_IN_STOCK] = "1" if qty > 0 else "0"
         return
     available = utils.resolve_variant_available(variant)
     if available is not None:
-        _set_cell(row, H.in_stock, "1" if available else "0")
+        row[_COL_IN_STOCK] = "1" if available else "0"
         return
-    _set_cell(row, H.in_stock, "1")
+    row[_COL_IN_STOCK] = "1"
 
 
 def _set_attributes(
-    row: dict[str, str],
+    row: list[str],
     option_names: list[str],
-    values_by_option: dict[str, str],
+    values: list[str],
 ) -> None:
-    for index, option_name in enumerate(option_names, start=1):
-        value = values_by_option.get(option_name, "")
-        _set_cell(row, f"Attribute {index} name", option_name)
-        _set_cell(row, f"Attribute {index} value(s)", value)
-        _set_cell(row, f"Attribute {index} visible", "1")
-        _set_cell(row, f"Attribute {index} global", "0")
+    for slot, option_name in enumerate(option_names):
+        if slot >= len(_ATTRIBUTE_COLUMNS):
+            raise ValueError(f"Unknown WooCommerce header assignment: Attribute {slot + 1} name")
+        name_column, value_column, visible_column, global_column = _ATTRIBUTE_COLUMNS[slot]
+        row[name_column] = option_name
+        row[value_column] = values[slot]
+        row[visible_column] = "1"
+        row[global_column] = "0"
 
 
-def _is_variable_product(product: Product, variants: list[Variant]) -> bool:
+def _is_variable_product(option_defs: list[OptionDef], variants: list[Variant]) -> bool:
     if len(variants) > 1:
         return True
-    for option in utils.resolve_option_defs(product):
-        if len(utils.ordered_unique(option.values)) > 1:
-            return True
-    return False
+    # resolve_option_defs already returns cleaned, de-duplicated values.
+    return any(len(option.values) > 1 for option in option_defs)
 
 
-def product_to_woocommerce_rows(
+def _iter_woocommerce_list_rows(
     product: Product,
     *,
     publish: bool | None = None,
     weight_unit: str = "kg",
-) -> list[dict[str, str]]:
+) -> Iterator[list[str]]:
     resolved_weight_unit = resolve_weight_unit("woocommerce", weight_unit)
-    resolved_columns = woocommerce_columns_for_weight_unit(resolved_weight_unit)
     resolved_weight_header = WOOCOMMERCE_WEIGHT_HEADER_BY_UNIT[resolved_weight_unit]
+    column_index = _COLUMN_INDEX_BY_UNIT[resolved_weight_unit]
     canonical_headers = set(_WOOCOMMERCE_CANONICAL_HEADERS_BASE)
     canonical_headers.add(resolved_weight_header)
     is_visible = utils.resolve_product_visibility(product, publish_override=publish)
     variants = utils.resolve_variants(product)
-    option_names = _resolve_option_names(product, variants)
+    option_defs = utils.resolve_option_defs(product)
+    option_names = _resolve_option_names(option_defs, variants)
     parent_sku = _resolve_parent_sku(product)
     images = utils.resolve_product_image_urls(product)
+    product_option_names = [option.name for option in option_defs]
     option_values_by_name = {
         option.name: option.values
-        for option in utils.resolve_option_defs(product)
+        for option in option_defs
         if option.name and option.name in option_names
     }
-    variant_option_maps = [
-        utils.resolve_variant_option_map(product, variant) for variant in variants
-    ]
-    parent_attribute_values = _resolve_parent_attribute_values(
-        variants,
-        option_names,
-        option_values_by_name,
-        variant_option_maps,
-    )
-    is_variable = _is_variable_product(product, variants)
+    option_columns = _resolve_option_columns(product, variants, option_names, product_option_names)
+    is_variable = _is_variable_product(option_defs, variants)
+    categories = utils.resolve_primary_category(product)
+    tags = _resolve_tags(product)
 
     if not is_variable:
         variant = variants[0]
-        row = _empty_row(resolved_columns)
-        _set_common_product_fields(row, product, is_visible=is_visible)
-        _set_cell(row, H.type, "simple")
-        _set_cell(row, H.sku, parent_sku)
-        _set_cell(row, H.name, product.title or "")
-        _set_cell(row, H.regular_price, _resolve_price(product, variant))
-        _set_cell(
-            row,
-            resolved_weight_header,
-            _resolve_weight(
-                product,
-                variant,
-                unit=resolved_weight_unit,
-            ),
-        )
-        _set_cell(
-            row,
-            H.images,
-            _resolve_images(images or [utils.resolve_variant_image_url(variant) or ""]),
+        row = _empty_row()
+        _set_parent_fields(row, product, is_visible=is_visible, categories=categories, tags=tags)
+        row[_COL_TYPE] = "simple"
+        row[_COL_SKU] = parent_sku
+        row[_COL_NAME] = product.title or ""
+        row[_COL_REGULAR_PRICE] = _resolve_price(product, variant)
+        row[_COL_WEIGHT] = _resolve_weight(product, variant, unit=resolved_weight_unit)
+        row[_COL_IMAGES] = _resolve_images(
+            images or [utils.resolve_variant_image_url(variant) or ""]
         )
         _apply_stock_fields(row, variant)
-        variant_option_values = variant_option_maps[0] if variant_option_maps else {}
-        simple_values: dict[str, str] = {}
-        for index, option_name in enumerate(option_names, start=1):
-            if option_name == "Option":
-                simple_values[option_name] = _fallback_option_value(variant, index)
-            else:
-                simple_values[option_name] = str(variant_option_values.get(option_name) or "")
-        _set_attributes(row, option_names, simple_values)
-        utils.apply_platform_unmapped_fields_to_row(
+        _set_attributes(row, option_names, [column[0] for column in option_columns])
+        utils.apply_platform_unmapped_fields_to_list_row(
             row,
             product,
             platform="woocommerce",
             canonical_headers=canonical_headers,
+            column_index=column_index,
         )
-        utils.apply_platform_unmapped_fields_to_row(
+        utils.apply_platform_unmapped_fields_to_list_row(
             row,
             product,
             platform="woocommerce",
             canonical_headers=canonical_headers,
+            column_index=column_index,
             variant=variant,
         )
-        return [row]
-
-    rows: list[dict[str, str]] = []
-    parent_row = _empty_row(resolved_columns)
-    _set_common_product_fields(parent_row, product, is_visible=is_visible)
-    _set_cell(parent_row, H.type, "variable")
-    _set_cell(parent_row, H.sku, parent_sku)
-    _set_cell(parent_row, H.name, product.title or "")
-    _set_cell(parent_row, H.regular_price, _resolve_price(product))
-    _set_cell(
-        parent_row, resolved_weight_header, _resolve_weight(product, unit=resolved_weight_unit)
-    )
-    _set_cell(parent_row, H.images, _resolve_images(images))
-    _set_cell(parent_row, H.in_stock, "1" if any(_variant_in_stock(v) for v in variants) else "0")
+        yield row
+        return
+
+    parent_row = _empty_row()
+    _set_parent_fields(parent_row, product, is_visible=is_visible, categories=categories, tags=tags)
+    parent_row[_COL_TYPE] = "variable"
+    parent_row[_COL_SKU] = parent_sku
+    parent_row[_COL_NAME] = product.title or ""
+    # Variations without their own price/weight reuse the parent's product-level values.
+    product_price = _resolve_price(product)
+    product_weight = _resolve_weight(product, unit=resolved_weight_unit)
+    parent_row[_COL_REGULAR_PRICE] = product_price
+    parent_row[_COL_WEIGHT] = product_weight
+    parent_row[_COL_IMAGES] = _resolve_images(images)
+    parent_row[_COL_IN_STOCK] = "1" if any(_variant_in_stock(v) for v in variants) else "0"
     _set_attributes(
         parent_row,
         option_names,
-        {name: ",".join(parent_attribute_values.get(name, [])) for name in option_names},
+        _resolve_parent_attribute_values(option_names, option_values_by_name, option_columns),
     )
-    utils.apply_platform_unmapped_fields_to_row(
+    utils.apply_platform_unmapped_fields_to_list_row(
         parent_row,
         product,
         platform="woocommerce",
         canonical_headers=canonical_headers,
+        column_index=column_index,
     )
-    rows.append(parent_row)
+    yield parent_row
 
     seen_skus = {parent_sku}
+    next_suffix_by_base: dict[str, int] = {}
     for index, variant in enumerate(variants, start=1):
-        variant_row = _empty_row(resolved_columns)
-        _set_common_product_fields(
-            variant_row,
-            product,
-            is_visible=is_visible,
-            include_descriptions=False,
-        )
-        _set_cell(variant_row, H.type, "variation")
+        variant_row = _empty_row()
+        _set_variation_fields(variant_row, product, is_visible=is_visible)
+        variant_row[_COL_TYPE] = "variation"
         variant_sku_base = f"{parent_sku}:{_resolve_variant_key(variant, index)}"
-        variant_sku = variant_sku_base
-        suffix = 2
+        # Resume from the last suffix issued for this base instead of re-probing from 2.
+        suffix = next_suffix_by_base.get(variant_sku_base, 1)
+        variant_sku = variant_sku_base if suffix == 1 else f"{variant_sku_base}-{suffix}"
         while variant_sku in seen_skus:
-            variant_sku = f"{variant_sku_base}-{suffix}"
             suffix += 1
+            variant_sku = f"{variant_sku_base}-{suffix}"
+        next_suffix_by_base[variant_sku_base] = suffix + 1
         seen_skus.add(variant_sku)
 
-        _set_cell(variant_row, H.sku, variant_sku)
-        _set_cell(variant_row, H.regular_price, _resolve_price(product, variant))
-        _set_cell(
-            variant_row,
-            resolved_weight_header,
-            _resolve_weight(
-                product,
-                variant,
-                unit=resolved_weight_unit,
-            ),
+        variant_row[_COL_SKU] = variant_sku
+        variant_row[_COL_REGULAR_PRICE] = (
+            _resolve_price(product, variant) if variant.price else product_price
+        )
+        variant_row[_COL_WEIGHT] = (
+            _resolve_weight(product, variant, unit=resolved_weight_unit)
+            if variant.weight is not None
+            else product_weight
         )
-        _set_cell(variant_row, H.images, utils.resolve_variant_image_url(variant))
-        _set_cell(variant_row, H.parent, parent_sku)
-        _set_cell(variant_row, H.categories, "")
-        _set_cell(variant_row, H.tags, "")
+        variant_row[_COL_IMAGES] = utils.resolve_variant_image_url(variant) or ""
+        variant_row[_COL_PARENT] = parent_sku
 
         _apply_stock_fields(variant_row, variant)
 
-        variant_option_values = variant_option_maps[index - 1]
-        variant_values: dict[str, str] = {}
-        for option_name in option_names:
-            if option_name == "Option":
-                variant_values[option_name] = _fallback_option_value(variant, index)
-            else:
-                variant_values[option_name] = str(variant_option_values.get(option_name) or "")
-        _set_attributes(variant_row, option_names, variant_values)
-        utils.apply_platform_unmapped_fields_to_row(
+        _set_attributes(variant_row, option_names, [column[index - 1] for column in option_columns])
+        utils.apply_platform_unmapped_fields_to_list_row(
             variant_row,
             product,
             platform="woocommerce",
             canonical_headers=canonical_headers,
+            column_index=column_index,
             variant=variant,
         )
-        rows.append(variant_row)
+        yield variant_row
 
-    return rows
+
+def product_to_woocommerce_list_rows(
+    product: Product,
+    *,
+    publish: bool | None = None,
+    weight_unit: str = "kg",
+) -> list[list[str]]:
+    return list(_iter_woocommerce_list_rows(product, publish=publish, weight_unit=weight_unit))
+
+
+def product_to_woocommerce_rows(
+    product: Product,
+    *,
+    publish: bool | None = None,
+    weight_unit: str = "kg",
+) -> list[dict[str, str]]:
+    rows = product_to_woocommerce_list_rows(product, publish=publish, weight_unit=weight_unit)
+    # The weight header varies by unit, so key each row by the unit's own column list.
+    columns = woocommerce_columns_for_weight_unit(weight_unit)
+    return [dict(zip(columns, row, strict=True)) for row in rows]
 
 
 def product_to_woocommerce_csv(
@@ -400,7 +468,19 @@ def product_to_woocommerce_csv(
     *,
     publish: bool | None = None,
     weight_unit: str = "kg",
+    now: datetime | None = None,
 ) -> tuple[str, str]:
     columns = woocommerce_columns_for_weight_unit(weight_unit)
-    rows = product_to_woocommerce_rows(product, publish=publish, weight_unit=weight_unit)
-    return utils.dict_rows_to_csv(rows, columns), utils.make_export_filename("woocommerce")
+    rows = _iter_woocommerce_list_rows(product, publish=publish, weight_unit=weight_unit)
+    return utils.list_rows_to_csv(rows, columns), utils.make_export_filename("woocommerce", now=now)
+
+
+def product_to_woocommerce_csv_stream(
+    product: Product,
+    *,
+    publish: bool | None = None,
+    weight_unit: str = "kg",
+) -> Iterator[str]:
+    columns = woocommerce_columns_for_weight_unit(weight_unit)
+    rows = _iter_woocommerce_list_rows(product, publish=publish, weight_unit=weight_unit)
+    return utils.iter_list_rows_csv(rows, columns)
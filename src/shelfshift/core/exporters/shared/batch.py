@@ -1,19 +1,35 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import TypeVar
+
 from ...canonical import Product
 from ...csv_schemas.bigcommerce import BIGCOMMERCE_COLUMNS, BIGCOMMERCE_LEGACY_COLUMNS
 from ...csv_schemas.shopify import SHOPIFY_COLUMNS
 from ...csv_schemas.squarespace import SQUARESPACE_COLUMNS
 from ...csv_schemas.wix import WIX_COLUMNS
-from ...csv_schemas.woocommerce import woocommerce_columns_for_weight_unit
+from ...csv_schemas.woocommerce import WOOCOMMERCE_COLUMNS, woocommerce_columns_for_weight_unit
 from ..platforms.bigcommerce import (
     BigCommerceCsvFormat,
     product_to_bigcommerce_rows,
 )
-from ..platforms.shopify import product_to_shopify_rows
+from ..platforms.shopify import product_to_shopify_list_rows
 from ..platforms.squarespace import product_to_squarespace_rows
-from ..platforms.wix import product_to_wix_rows
-from ..platforms.woocommerce import product_to_woocommerce_rows
+from ..platforms.wix import product_to_wix_list_rows
+from ..platforms.woocommerce import product_to_woocommerce_list_rows
 from . import utils
 
+_SHOPIFY_HANDLE_INDEX = SHOPIFY_COLUMNS.index("URL handle")
+_WIX_HANDLE_INDEX = WIX_COLUMNS.index("handle")
+_WIX_FIELD_TYPE_INDEX = WIX_COLUMNS.index("fieldType")
+_WOOCOMMERCE_SKU_INDEX = WOOCOMMERCE_COLUMNS.index("SKU")
+_WOOCOMMERCE_PARENT_INDEX = WOOCOMMERCE_COLUMNS.index("Parent")
+# Products per worker task; large enough to amortize pickling round-trips.
+_PARALLEL_CHUNKSIZE = 64
+
+_RowT = TypeVar("_RowT")
+
 
 def _require_non_empty_products(products: list[Product], *, label: str) -> None:
     if not products:
@@ -35,23 +51,80 @@ def _require_unique(values: list[str], *, label: str) -> None:
         raise ValueError(f"Duplicate {label} values in batch export: {joined}")
 
 
+def _map_product_rows(
+    build_rows: Callable[[Product], list[_RowT]],
+    products: list[Product],
+    *,
+    workers: int | None,
+) -> Iterator[list[_RowT]]:
+    # Row builders are pure, so large catalogs can fan out across processes.
+    if workers is None or workers <= 1 or len(products) <= 1:
+        yield from map(build_rows, products)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(build_rows, products, chunksize=_PARALLEL_CHUNKSIZE)
+
+
+def _iter_shopify_rows(
+    products: list[Product],
+    *,
+    publish: bool | None,
+    weight_unit: str,
+    handles: list[str],
+    workers: int | None,
+) -> Iterator[list[str]]:
+    build_rows = partial(product_to_shopify_list_rows, publish=publish, weight_unit=weight_unit)
+    for product_rows in _map_product_rows(build_rows, products, workers=workers):
+        if product_rows:
+            handles.append(product_rows[0][_SHOPIFY_HANDLE_INDEX].strip())
+        yield from product_rows
+
+
 def products_to_shopify_csv(
     products: list[Product],
     *,
     publish: bool | None = None,
     weight_unit: str = "g",
+    now: datetime | None = None,
+    workers: int | None = None,
 ) -> tuple[str, str]:
     _require_non_empty_products(products, label="Shopify batch export")
-    rows: list[dict[str, str]] = []
     handles: list[str] = []
-    for product in products:
-        product_rows = product_to_shopify_rows(product, publish=publish, weight_unit=weight_unit)
-        if product_rows:
-            handles.append(str(product_rows[0].get("URL handle") or "").strip())
-        rows.extend(product_rows)
+    csv_text = utils.list_rows_to_csv(
+        _iter_shopify_rows(
+            products, publish=publish, weight_unit=weight_unit, handles=handles, workers=workers
+        ),
+        SHOPIFY_COLUMNS,
+    )
 
     _require_unique(handles, label="Shopify Handle")
-    return utils.dict_rows_to_csv(rows, SHOPIFY_COLUMNS), utils.make_export_filename("shopify")
+    return csv_text, utils.make_export_filename("shopify", now=now)
+
+
+def _iter_bigcommerce_rows(
+    products: list[Product],
+    *,
+    publish: bool | None,
+    csv_format: BigCommerceCsvFormat,
+    weight_unit: str,
+    product_keys: list[str],
+    workers: int | None,
+) -> Iterator[dict[str, str]]:
+    build_rows = partial(
+        product_to_bigcommerce_rows,
+        publish=publish,
+        csv_format=csv_format,
+        weight_unit=weight_unit,
+    )
+    for product_rows in _map_product_rows(build_rows, products, workers=workers):
+        if csv_format == "modern":
+            product_row = next((row for row in product_rows if row.get("Item") == "Product"), None)
+            if product_row is not None:
+                product_keys.append(str(product_row.get("SKU") or "").strip())
+        else:
+            if product_rows:
+                product_keys.append(str(product_rows[0].get("Product Code/SKU") or "").strip())
+        yield from product_rows
 
 
 def products_to_bigcommerce_csv(
@@ -60,32 +133,47 @@ def products_to_bigcommerce_csv(
     publish: bool | None = None,
     csv_format: BigCommerceCsvFormat = "modern",
     weight_unit: str = "kg",
+    now: datetime | None = None,
+    workers: int | None = None,
 ) -> tuple[str, str]:
     _require_non_empty_products(products, label="BigCommerce batch export")
-    rows: list[dict[str, str]] = []
     product_keys: list[str] = []
-    for product in products:
-        product_rows = product_to_bigcommerce_rows(
-            product,
+    columns = BIGCOMMERCE_COLUMNS if csv_format == "modern" else BIGCOMMERCE_LEGACY_COLUMNS
+    csv_text = utils.dict_rows_to_csv(
+        _iter_bigcommerce_rows(
+            products,
             publish=publish,
             csv_format=csv_format,
             weight_unit=weight_unit,
-        )
-        if csv_format == "modern":
-            product_row = next((row for row in product_rows if row.get("Item") == "Product"), None)
-            if product_row is not None:
-                product_keys.append(str(product_row.get("SKU") or "").strip())
-        else:
-            if product_rows:
-                product_keys.append(str(product_rows[0].get("Product Code/SKU") or "").strip())
-        rows.extend(product_rows)
+            product_keys=product_keys,
+            workers=workers,
+        ),
+        columns,
+    )
 
     _require_unique(
         product_keys,
         label="BigCommerce SKU" if csv_format == "modern" else "BigCommerce Code",
     )
-    columns = BIGCOMMERCE_COLUMNS if csv_format == "modern" else BIGCOMMERCE_LEGACY_COLUMNS
-    return utils.dict_rows_to_csv(rows, columns), utils.make_export_filename("bigcommerce")
+    return csv_text, utils.make_export_filename("bigcommerce", now=now)
+
+
+def _iter_wix_rows(
+    products: list[Product],
+    *,
+    publish: bool | None,
+    weight_unit: str,
+    handles: list[str],
+    workers: int | None,
+) -> Iterator[list[str]]:
+    build_rows = partial(product_to_wix_list_rows, publish=publish, weight_unit=weight_unit)
+    for product_rows in _map_product_rows(build_rows, products, workers=workers):
+        product_row = next(
+            (row for row in product_rows if row[_WIX_FIELD_TYPE_INDEX] == "PRODUCT"), None
+        )
+        if product_row is not None:
+            handles.append(product_row[_WIX_HANDLE_INDEX].strip())
+        yield from product_rows
 
 
 def products_to_wix_csv(
@@ -93,19 +181,20 @@ def products_to_wix_csv(
     *,
     publish: bool | None = None,
     weight_unit: str = "kg",
+    now: datetime | None = None,
+    workers: int | None = None,
 ) -> tuple[str, str]:
     _require_non_empty_products(products, label="Wix batch export")
-    rows: list[dict[str, str]] = []
     handles: list[str] = []
-    for product in products:
-        product_rows = product_to_wix_rows(product, publish=publish, weight_unit=weight_unit)
-        product_row = next((row for row in product_rows if row.get("fieldType") == "PRODUCT"), None)
-        if product_row is not None:
-            handles.append(str(product_row.get("handle") or "").strip())
-        rows.extend(product_rows)
+    csv_text = utils.list_rows_to_csv(
+        _iter_wix_rows(
+            products, publish=publish, weight_unit=weight_unit, handles=handles, workers=workers
+        ),
+        WIX_COLUMNS,
+    )
 
     _require_unique(handles, label="Wix handle")
-    return utils.dict_rows_to_csv(rows, WIX_COLUMNS), utils.make_export_filename("wix")
+    return csv_text, utils.make_export_filename("wix", now=now)
 
 
 def products_to_squarespace_csv(
@@ -115,49 +204,75 @@ def products_to_squarespace_csv(
     product_page: str = "",
     product_url: str = "",
     weight_unit: str = "kg",
+    now: datetime | None = None,
+    workers: int | None = None,
 ) -> tuple[str, str]:
     _require_non_empty_products(products, label="Squarespace batch export")
-    rows: list[dict[str, str]] = []
-    for product in products:
-        rows.extend(
-            product_to_squarespace_rows(
-                product,
-                publish=publish,
-                product_page=product_page,
-                product_url=product_url,
-                weight_unit=weight_unit,
-            )
-        )
+    build_rows = partial(
+        product_to_squarespace_rows,
+        publish=publish,
+        product_page=product_page,
+        product_url=product_url,
+        weight_unit=weight_unit,
+    )
+    rows = (
+        row
+        for product_rows in _map_product_rows(build_rows, products, workers=workers)
+        for row in product_rows
+    )
     # Squarespace's `product_page`/`product_url` are intentionally left blank in batch flows for now.
     return utils.dict_rows_to_csv(rows, SQUARESPACE_COLUMNS), utils.make_export_filename(
-        "squarespace"
+        "squarespace", now=now
     )
 
 
+def _iter_woocommerce_rows(
+    products: list[Product],
+    *,
+    publish: bool | None,
+    weight_unit: str,
+    parent_skus: list[str],
+    workers: int | None,
+) -> Iterator[list[str]]:
+    build_rows = partial(product_to_woocommerce_list_rows, publish=publish, weight_unit=weight_unit)
+    for product_rows in _map_product_rows(build_rows, products, workers=workers):
+        parent_row = next(
+            (
+                row
+                for row in product_rows
+                if not row[_WOOCOMMERCE_PARENT_INDEX] and row[_WOOCOMMERCE_SKU_INDEX]
+            ),
+            None,
+        )
+        if parent_row is not None:
+            parent_skus.append(parent_row[_WOOCOMMERCE_SKU_INDEX].strip())
+        yield from product_rows
+
+
 def products_to_woocommerce_csv(
     products: list[Product],
     *,
     publish: bool | None = None,
     weight_unit: str = "kg",
+    now: datetime | None = None,
+    workers: int | None = None,
 ) -> tuple[str, str]:
     _require_non_empty_products(products, label="WooCommerce batch export")
     columns = woocommerce_columns_for_weight_unit(weight_unit)
-    rows: list[dict[str, str]] = []
     parent_skus: list[str] = []
-    for product in products:
-        product_rows = product_to_woocommerce_rows(
-            product, publish=publish, weight_unit=weight_unit
-        )
-        parent_row = next(
-            (row for row in product_rows if row.get("Parent") in {"", None} and row.get("SKU")),
-            None,
-        )
-        if parent_row is not None:
-            parent_skus.append(str(parent_row.get("SKU") or "").strip())
-        rows.extend(product_rows)
+    csv_text = utils.list_rows_to_csv(
+        _iter_woocommerce_rows(
+            products,
+            publish=publish,
+            weight_unit=weight_unit,
+            parent_skus=parent_skus,
+            workers=workers,
+        ),
+        columns,
+    )
 
     _require_unique(parent_skus, label="WooCommerce parent SKU")
-    return utils.dict_rows_to_csv(rows, columns), utils.make_export_filename("woocommerce")
+    return csv_text, utils.make_export_filename("woocommerce", now=now)
 
 
 __all__ = [
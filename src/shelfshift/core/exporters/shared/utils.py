@@ -1,8 +1,11 @@
 import csv
 import io
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
+from functools import lru_cache
+
+from slugify import slugify
 
 from ...canonical import (
     OptionDef,
@@ -28,19 +31,77 @@ from ...canonical.helpers import (
     resolve_variant_option_values as model_resolve_variant_option_values,
 )
 
-_SAFE_DEST_RE = re.compile(r"[^a-z0-9-]+")
+
+class _SafeDestTable(dict):
+    # Any code point not explicitly kept becomes a dash separator.
+    def __missing__(self, codepoint: int) -> str:
+        return "-"
+
+
+_HANDLE_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_SAFE_DEST_TABLE = _SafeDestTable(
+    {ord(char): char for char in "abcdefghijklmnopqrstuvwxyz0123456789-"}
+)
+
+
+def _unique_cleaned(items: Iterable[str]) -> dict[str, None]:
+    cleaned = ((item or "").strip() for item in items)
+    return dict.fromkeys(value for value in cleaned if value)
 
 
 def ordered_unique(items: Iterable[str]) -> list[str]:
-    values: list[str] = []
-    seen: set[str] = set()
-    for item in items:
-        cleaned = (item or "").strip()
-        if not cleaned or cleaned in seen:
-            continue
-        seen.add(cleaned)
-        values.append(cleaned)
-    return values
+    return list(_unique_cleaned(items))
+
+
+def join_unique(items: Iterable[str], separator: str) -> str:
+    return separator.join(_unique_cleaned(items))
+
+
+@lru_cache(maxsize=4096)
+def _tidy_tags(tags: tuple[str, ...]) -> tuple[str, ...]:
+    # Tags differing only by case collapse to the first spelling seen.
+    by_key: dict[str, str] = {}
+    for tag in tags:
+        value = (tag or "").strip()
+        if value:
+            by_key.setdefault(value.lower(), value)
+    return tuple(by_key[key] for key in sorted(by_key))
+
+
+def tidy_tags(product: Product) -> tuple[str, ...]:
+    return _tidy_tags(tuple(product.tags or ()))
+
+
+@lru_cache(maxsize=4096)
+def cached_slugify(value: str, separator: str = "-") -> str:
+    return slugify(value, separator=separator)
+
+
+def normalize_handle(value: str) -> str:
+    normalized = value.strip().lower()
+    if _HANDLE_RE.fullmatch(normalized):
+        return normalized
+    return ""
+
+
+def resolve_product_handle(product: Product) -> str:
+    if product.source.slug:
+        handle = normalize_handle(product.source.slug)
+        if handle:
+            return handle
+
+    if product.title:
+        # Titles that already look like a handle need no slugify round-trip.
+        title_handle = normalize_handle(product.title) or normalize_handle(
+            cached_slugify(product.title)
+        )
+        if title_handle:
+            return title_handle
+
+    fallback = cached_slugify(
+        f"{product.source.platform or 'product'}-{product.source.id or 'item'}"
+    )
+    return normalize_handle(fallback) or "product-item"
 
 
 def format_number(value: float | None, *, decimals: int) -> str:
@@ -49,14 +110,41 @@ def format_number(value: float | None, *, decimals: int) -> str:
     return f"{value:.{decimals}f}".rstrip("0").rstrip(".")
 
 
-def dict_rows_to_csv(rows: list[dict[str, str]], columns: list[str]) -> str:
+def _ordered_dict_rows(rows: Iterable[dict[str, str]], columns: list[str]) -> Iterator[list[str]]:
+    column_set = set(columns)
+    for row in rows:
+        if not row.keys() <= column_set:
+            extras = ", ".join(repr(key) for key in row if key not in column_set)
+            raise ValueError(f"dict contains fields not in fieldnames: {extras}")
+        yield [row.get(column, "") for column in columns]
+
+
+def dict_rows_to_csv(rows: Iterable[dict[str, str]], columns: list[str]) -> str:
+    # Order each row once here and let csv.writer.writerows do the rest in C.
+    return list_rows_to_csv(_ordered_dict_rows(rows, columns), columns)
+
+
+def list_rows_to_csv(rows: Iterable[list[str]], columns: list[str]) -> str:
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=columns, lineterminator="\n")
-    writer.writeheader()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(columns)
     writer.writerows(rows)
     return output.getvalue()
 
 
+def iter_list_rows_csv(rows: Iterable[list[str]], columns: list[str]) -> Iterator[str]:
+    # One reusable buffer; each yielded chunk is the header or a single row.
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(columns)
+    yield output.getvalue()
+    for row in rows:
+        output.seek(0)
+        output.truncate(0)
+        writer.writerow(row)
+        yield output.getvalue()
+
+
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -68,11 +156,9 @@ def utc_timestamp_compact(now: datetime | None = None) -> str:
 
 
 def make_export_filename(destination: str, *, now: datetime | None = None) -> str:
-    cleaned = (destination or "").strip().lower().replace("_", "-")
-    cleaned = _SAFE_DEST_RE.sub("-", cleaned).strip("-")
-    if not cleaned:
-        cleaned = "export"
-    return f"{cleaned}-{utc_timestamp_compact(now)}.csv"
+    translated = (destination or "").strip().lower().translate(_SAFE_DEST_TABLE)
+    cleaned = "-".join(part for part in translated.split("-") if part)
+    return f"{cleaned or 'export'}-{utc_timestamp_compact(now)}.csv"
 
 
 def _clean_text(value: object) -> str:
@@ -219,15 +305,36 @@ def resolve_option_defs(product: Product) -> list[OptionDef]:
     return model_resolve_option_defs(product)
 
 
-def resolve_variant_option_map(product: Product, variant: Variant) -> dict[str, str]:
+def resolve_option_names(product: Product, *, limit: int | None = None) -> list[str]:
+    names: list[str] = []
+    for option in product.options:
+        name = _clean_text(option.name)
+        if not name:
+            continue
+        names.append(name)
+        if limit is not None and len(names) >= limit:
+            break
+    return names
+
+
+def resolve_variant_option_map(
+    product: Product,
+    variant: Variant,
+    *,
+    option_names: list[str] | None = None,
+) -> dict[str, str]:
     values_by_name: dict[str, str] = {}
-    for option in model_resolve_variant_option_values(product, variant):
+    for option in model_resolve_variant_option_values(product, variant, option_names=option_names):
         if option.name in values_by_name:
             continue
         values_by_name[option.name] = option.value
     return values_by_name
 
 
+def fallback_option_value(variant: Variant, index: int) -> str:
+    return str(variant.title or variant.sku or variant.id or f"Variant {index}")
+
+
 def resolve_taxonomy_paths(product: Product) -> list[list[str]]:
     return model_resolve_taxonomy_paths(product)
 
@@ -335,6 +442,10 @@ def resolve_platform_unmapped_fields(
     platform: str,
     variant: Variant | None = None,
 ) -> dict[str, str]:
+    # Most rows carry no passthrough fields; skip the cleaning pass for them.
+    source_fields = variant.unmapped_fields if variant else product.unmapped_fields
+    if not source_fields:
+        return {}
     target_platform = _clean_text(platform)
     if not target_platform:
         return {}
@@ -377,10 +488,33 @@ def apply_platform_unmapped_fields_to_row(
         row[header] = value
 
 
+def apply_platform_unmapped_fields_to_list_row(
+    row: list[str],
+    product: Product,
+    *,
+    platform: str,
+    canonical_headers: set[str],
+    column_index: dict[str, int],
+    variant: Variant | None = None,
+) -> None:
+    passthrough_values = resolve_platform_unmapped_fields(
+        product,
+        platform=platform,
+        variant=variant,
+    )
+    for header, value in passthrough_values.items():
+        if header in canonical_headers:
+            continue
+        index = column_index.get(header)
+        if index is None:
+            continue
+        row[index] = value
+
+
 def resolve_variants(product: Product) -> list[Variant]:
-    variants = list(product.variants or [])
-    if variants:
-        return variants
+    # Returns the product's own list when present; callers must not mutate it.
+    if product.variants:
+        return product.variants
 
     default_price = None
     if product.price and product.price.current.amount is not None:
@@ -74,8 +74,7 @@ def _rows_to_csv_text(headers: list[str], rows: list[dict[str, str]]) -> str:
     out = io.StringIO()
     writer = csv.DictWriter(out, fieldnames=headers, extrasaction="ignore", lineterminator="\n")
     writer.writeheader()
-    for row in rows:
-        writer.writerow(row)
+    writer.writerows(rows)
     return out.getvalue()
 
 
@@ -102,13 +101,12 @@ def parse_shopify_csv_batch(csv_text: str, *, source_platform: str = "shopify")
 def parse_wix_csv_batch(csv_text: str, *, source_weight_unit: str) -> list[Product]:
     headers, rows = csv_rows(csv_text)
     # Let the single-product parser validate required headers per group.
-    handles: list[str] = []
+    handles: dict[str, None] = {}
     for row in rows:
         handle = str(row.get("handle") or "").strip()
         if not handle:
             continue
-        if handle not in handles:
-            handles.append(handle)
+        handles[handle] = None
     if not handles:
         raise ValueError("Wix CSV must include at least one row with handle.")
 
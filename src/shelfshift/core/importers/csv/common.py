@@ -276,18 +276,38 @@ def add_csv_provenance(
     product.provenance = provenance
 
 
+def option_map_from_row(
+    row: dict[str, str],
+    option_headers: Iterable[tuple[str, str]],
+    *,
+    value_sep: str | None = None,
+) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for name_header, value_header in option_headers:
+        name = str(row.get(name_header) or "").strip()
+        value = str(row.get(value_header) or "").strip()
+        if not name or not value:
+            continue
+        if value_sep is not None:
+            # Multi-value cells list every choice; a variant row selects the first and
+            # separator-only cells keep their raw text.
+            tokens = split_tokens(value, sep=value_sep)
+            value = tokens[0] if tokens else value
+        out[name] = value
+    return out
+
+
 def option_defs_from_option_maps(option_maps: list[dict[str, str]]) -> list[OptionDef]:
-    values_by_name: dict[str, list[str]] = {}
+    # Insertion-ordered dicts keep first-seen value order with O(1) membership checks.
+    values_by_name: dict[str, dict[str, None]] = {}
     for option_map in option_maps:
         for key, value in option_map.items():
             name = str(key or "").strip()
             token = str(value or "").strip()
             if not name or not token:
                 continue
-            values_by_name.setdefault(name, [])
-            if token not in values_by_name[name]:
-                values_by_name[name].append(token)
-    return [OptionDef(name=name, values=values) for name, values in values_by_name.items()]
+            values_by_name.setdefault(name, {})[token] = None
+    return [OptionDef(name=name, values=list(values)) for name, values in values_by_name.items()]
 
 
 def tags_from_keywords(value: str) -> list[str]:
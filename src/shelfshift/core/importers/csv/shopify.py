@@ -32,6 +32,13 @@ _SHOPIFY_CANONICAL_MAPPED_HEADERS: set[str] = infer_mapped_headers(
         (SHOPIFY_OPTION_VALUE_TEMPLATES, range(1, 4)),
     ],
 )
+_OPTION_HEADERS: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...] = tuple(
+    (
+        tuple(template.replace("{i}", str(index)) for template in SHOPIFY_OPTION_NAME_TEMPLATES),
+        tuple(template.replace("{i}", str(index)) for template in SHOPIFY_OPTION_VALUE_TEMPLATES),
+    )
+    for index in range(1, 4)
+)
 
 
 def _first_non_empty(row: dict[str, str], *keys: str) -> str:
@@ -63,14 +70,12 @@ def shopify_row_handle(row: dict[str, str]) -> str:
 
 
 def extract_shopify_handles(rows: list[dict[str, str]]) -> list[str]:
-    handles: list[str] = []
+    handles: dict[str, None] = {}
     for row in rows:
         handle = shopify_row_handle(row)
-        if not handle:
-            continue
-        if handle not in handles:
-            handles.append(handle)
-    return handles
+        if handle:
+            handles[handle] = None
+    return list(handles)
 
 
 def parse_shopify_csv(csv_text: str, *, source_platform: str = "shopify") -> Product:
@@ -88,15 +93,15 @@ def parse_shopify_csv(csv_text: str, *, source_platform: str = "shopify") -> Pro
     selected_handle = handles[0]
     selected_rows = [row for row in rows if shopify_row_handle(row) == selected_handle]
     product_row = selected_rows[0]
-    product_images: list[str] = []
+    product_images: dict[str, None] = {}
     variants: list[Variant] = []
     option_maps: list[dict[str, str]] = []
     variant_source_rows: list[dict[str, str]] = []
 
     for index, row in enumerate(selected_rows, start=1):
         image_src = _first_non_empty(row, *SHOPIFY_HEADER_ALIASES["product_image"])
-        if image_src and image_src not in product_images:
-            product_images.append(image_src)
+        if image_src:
+            product_images[image_src] = None
 
         sku = _first_non_empty(row, *SHOPIFY_HEADER_ALIASES["variant_sku"])
         if not sku:
@@ -104,21 +109,9 @@ def parse_shopify_csv(csv_text: str, *, source_platform: str = "shopify") -> Pro
         variant_source_rows.append(row)
 
         option_map: dict[str, str] = {}
-        for option_index in range(1, 4):
-            option_name = _first_non_empty(
-                row,
-                *(
-                    template.replace("{i}", str(option_index))
-                    for template in SHOPIFY_OPTION_NAME_TEMPLATES
-                ),
-            )
-            option_value = _first_non_empty(
-                row,
-                *(
-                    template.replace("{i}", str(option_index))
-                    for template in SHOPIFY_OPTION_VALUE_TEMPLATES
-                ),
-            )
+        for name_headers, value_headers in _OPTION_HEADERS:
+            option_name = _first_non_empty(row, *name_headers)
+            option_value = _first_non_empty(row, *value_headers)
             if option_name and option_value:
                 option_map[option_name] = option_value
         option_maps.append(option_map)
@@ -188,7 +181,7 @@ def parse_shopify_csv(csv_text: str, *, source_platform: str = "shopify") -> Pro
         track_quantity=any(variant.inventory.track_quantity for variant in variants),
         is_digital=not requires_shipping,
         is_published=is_published,
-        media=media_from_urls(product_images),
+        media=media_from_urls(list(product_images)),
         identifiers=make_identifiers(values={"source_product_id": selected_handle}),
     )
     apply_first_non_empty_unmapped_fields(
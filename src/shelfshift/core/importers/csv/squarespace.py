@@ -14,6 +14,7 @@ from .common import (
     make_identifiers,
     media_from_urls,
     option_defs_from_option_maps,
+    option_map_from_row,
     parse_bool,
     parse_float,
     parse_int,
@@ -33,6 +34,13 @@ _SQUARESPACE_CANONICAL_MAPPED_HEADERS: set[str] = infer_mapped_headers(
         ((SQUARESPACE_OPTION_NAME_TEMPLATE, SQUARESPACE_OPTION_VALUE_TEMPLATE), range(1, 7))
     ],
 )
+_OPTION_HEADERS: tuple[tuple[str, str], ...] = tuple(
+    (
+        SQUARESPACE_OPTION_NAME_TEMPLATE.replace("{i}", str(index)),
+        SQUARESPACE_OPTION_VALUE_TEMPLATE.replace("{i}", str(index)),
+    )
+    for index in range(1, 7)
+)
 
 
 def _segment_rows(rows: list[dict[str, str]]) -> tuple[list[dict[str, str]], int]:
@@ -74,16 +82,7 @@ def parse_squarespace_csv(csv_text: str, *, source_weight_unit: str) -> Product:
         if not sku:
             continue
         variant_source_rows.append(row)
-        option_map: dict[str, str] = {}
-        for option_index in range(1, 7):
-            name = str(
-                row.get(SQUARESPACE_OPTION_NAME_TEMPLATE.replace("{i}", str(option_index))) or ""
-            ).strip()
-            value = str(
-                row.get(SQUARESPACE_OPTION_VALUE_TEMPLATE.replace("{i}", str(option_index))) or ""
-            ).strip()
-            if name and value:
-                option_map[name] = value
+        option_map = option_map_from_row(row, _OPTION_HEADERS)
         option_maps.append(option_map)
 
         stock_raw = _field_value(row, "stock")
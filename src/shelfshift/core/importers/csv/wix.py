@@ -14,12 +14,12 @@ from .common import (
     make_identifiers,
     media_from_urls,
     option_defs_from_option_maps,
+    option_map_from_row,
     parse_bool,
     parse_float,
     parse_int,
     price_from_amount,
     require_headers,
-    split_tokens,
     unmapped_headers_from_csv,
     weight_object,
     weight_to_grams,
@@ -31,6 +31,13 @@ _WIX_CANONICAL_MAPPED_HEADERS: set[str] = infer_mapped_headers(
         ((WIX_OPTION_NAME_TEMPLATE, WIX_OPTION_CHOICES_TEMPLATE), range(1, 7))
     ],
 )
+_OPTION_HEADERS: tuple[tuple[str, str], ...] = tuple(
+    (
+        WIX_OPTION_NAME_TEMPLATE.replace("{i}", str(index)),
+        WIX_OPTION_CHOICES_TEMPLATE.replace("{i}", str(index)),
+    )
+    for index in range(1, 7)
+)
 
 
 def _variant_inventory_from_wix(value: str) -> Inventory:
@@ -64,14 +71,13 @@ def parse_wix_csv(csv_text: str, *, source_weight_unit: str) -> Product:
         headers,
         mapped_headers=_WIX_CANONICAL_MAPPED_HEADERS,
     )
-    handles: list[str] = []
+    handles: dict[str, None] = {}
     selected_handle = ""
     for row in rows:
         handle = _field_value(row, "handle")
         if not handle:
             continue
-        if handle not in handles:
-            handles.append(handle)
+        handles[handle] = None
         if not selected_handle:
             selected_handle = handle
     if not selected_handle:
@@ -94,17 +100,7 @@ def parse_wix_csv(csv_text: str, *, source_weight_unit: str) -> Product:
     source_rows = variant_rows or [product_row]
     for index, row in enumerate(source_rows, start=1):
         sku = _field_value(row, "sku") or f"{selected_handle}:{index}"
-        option_map: dict[str, str] = {}
-        for option_index in range(1, 7):
-            name = str(
-                row.get(WIX_OPTION_NAME_TEMPLATE.replace("{i}", str(option_index))) or ""
-            ).strip()
-            value = str(
-                row.get(WIX_OPTION_CHOICES_TEMPLATE.replace("{i}", str(option_index))) or ""
-            ).strip()
-            if name and value:
-                selected = split_tokens(value, sep=";")
-                option_map[name] = selected[0] if selected else value
+        option_map = option_map_from_row(row, _OPTION_HEADERS, value_sep=";")
         option_maps.append(option_map)
 
         weight_grams = weight_to_grams(
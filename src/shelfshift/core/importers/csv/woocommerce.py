@@ -37,6 +37,13 @@ _WOOCOMMERCE_CANONICAL_MAPPED_HEADERS_BASE: set[str] = infer_mapped_headers(
         )
     ],
 )
+_ATTRIBUTE_HEADERS: tuple[tuple[str, str], ...] = tuple(
+    (
+        WOOCOMMERCE_ATTRIBUTE_NAME_TEMPLATE.replace("{i}", str(index)),
+        WOOCOMMERCE_ATTRIBUTE_VALUES_TEMPLATE.replace("{i}", str(index)),
+    )
+    for index in range(1, 4)
+)
 
 
 def _taxonomy_from_categories(value: str) -> CategorySet:
@@ -63,13 +70,9 @@ def _field_value(row: dict[str, str], field: str) -> str:
 
 def _row_option_map(row: dict[str, str]) -> dict[str, str]:
     out: dict[str, str] = {}
-    for index in range(1, 4):
-        name = str(
-            row.get(WOOCOMMERCE_ATTRIBUTE_NAME_TEMPLATE.replace("{i}", str(index))) or ""
-        ).strip()
-        value = str(
-            row.get(WOOCOMMERCE_ATTRIBUTE_VALUES_TEMPLATE.replace("{i}", str(index))) or ""
-        ).strip()
+    for name_header, value_header in _ATTRIBUTE_HEADERS:
+        name = str(row.get(name_header) or "").strip()
+        value = str(row.get(value_header) or "").strip()
         if not name or not value:
             continue
         first_value = split_tokens(value, sep=",")
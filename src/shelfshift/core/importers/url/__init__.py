@@ -1,5 +1,7 @@
 """URL-based importers."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ...canonical import Product
 from ...detect.url import detect_product_url as _detect_product_url
 from .api import fetch_product_details as _fetch_product_details
@@ -32,16 +34,34 @@ def import_product_from_url(product_url: str) -> Product:
     return _fetch_product_details(normalized_url)
 
 
-def import_products_from_urls(urls: list[str]) -> tuple[list[Product], list[dict[str, str]]]:
+def _import_product_or_error(url: str) -> Product | dict[str, str]:
+    try:
+        return import_product_from_url(url)
+    except ValueError as exc:
+        return {"url": url, "detail": str(exc)}
+    except Exception as exc:
+        return {"url": url, "detail": f"Internal import error: {exc}"}
+
+
+def import_products_from_urls(
+    urls: list[str],
+    *,
+    workers: int | None = None,
+) -> tuple[list[Product], list[dict[str, str]]]:
+    # Fetches are network-bound, so threads overlap their latency; results keep input order.
+    if workers is None or workers <= 1 or len(urls) <= 1:
+        results = list(map(_import_product_or_error, urls))
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as pool:
+            results = list(pool.map(_import_product_or_error, urls))
+
     products: list[Product] = []
     errors: list[dict[str, str]] = []
-    for url in urls:
-        try:
-            products.append(import_product_from_url(url))
-        except ValueError as exc:
-            errors.append({"url": url, "detail": str(exc)})
-        except Exception as exc:
-            errors.append({"url": url, "detail": f"Internal import error: {exc}"})
+    for result in results:
+        if isinstance(result, dict):
+            errors.append(result)
+        else:
+            products.append(result)
     return products, errors
 
 
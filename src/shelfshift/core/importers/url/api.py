@@ -1,9 +1,15 @@
+from functools import lru_cache
+
 from ...canonical import Product
 from ...detect.url import detect_product_url
 from .common import ProductClient
-from .platforms.shopify import ShopifyClient
-from .platforms.squarespace import SquarespaceClient
-from .platforms.woocommerce import WooCommerceClient
+
+# Client modules are imported on first use, so single-platform imports skip the others.
+_CLIENT_TYPES: dict[str, tuple[str, str]] = {
+    "shopify": ("shelfshift.core.importers.url.platforms.shopify", "ShopifyClient"),
+    "squarespace": ("shelfshift.core.importers.url.platforms.squarespace", "SquarespaceClient"),
+    "woocommerce": ("shelfshift.core.importers.url.platforms.woocommerce", "WooCommerceClient"),
+}
 
 
 class ProductClientFactory:
@@ -15,11 +21,8 @@ class ProductClientFactory:
     """
 
     def __init__(self):
-        self._clients: dict[str, ProductClient] = {
-            "shopify": ShopifyClient(),
-            "squarespace": SquarespaceClient(),
-            "woocommerce": WooCommerceClient(),
-        }
+        # Clients (and their HTTP sessions) are built on first use per platform.
+        self._clients: dict[str, ProductClient] = {}
 
     def for_url(self, url: str) -> ProductClient:
         info = detect_product_url(url)
@@ -27,13 +30,24 @@ class ProductClientFactory:
         if not platform:
             raise ValueError("Unrecognized platform for URL.")
         client = self._clients.get(platform)
-        if not client:
-            raise ValueError(f"No client for platform {platform}")
+        if client is None:
+            target = _CLIENT_TYPES.get(platform)
+            if target is None:
+                raise ValueError(f"No client for platform {platform}")
+            module_name, class_name = target
+            module = __import__(module_name, fromlist=[class_name])
+            client = self._clients[platform] = getattr(module, class_name)()
         return client
 
 
+@lru_cache(maxsize=1)
+def _default_factory() -> ProductClientFactory:
+    # Shared across imports so each client's HTTP session (and its keep-alive pool) is reused.
+    return ProductClientFactory()
+
+
 def fetch_product_details(url: str) -> Product:
-    client = ProductClientFactory().for_url(url)
+    client = _default_factory().for_url(url)
     return client.fetch_product(url)
 
 
@@ -1,6 +1,7 @@
 import json
+import math
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 import requests
@@ -18,6 +19,19 @@ from ...canonical import (
 from ...canonical.helpers import normalize_currency, parse_decimal_money
 from ..identifiers import make_identifiers as _make_identifiers
 
+# Sized for threaded multi-URL imports so concurrent fetches to one host keep their connections.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 32
+# Browser-like headers for HTML page fetches; shared and never mutated per request.
+HTML_REQUEST_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
 
 def http_session(timeout: int = 20) -> requests.Session:
     s = requests.Session()
@@ -28,7 +42,11 @@ def http_session(timeout: int = 20) -> requests.Session:
         allowed_methods=("GET", "POST"),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(
+        max_retries=retries,
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+    )
     s.mount("https://", adapter)
     s.mount("http://", adapter)
     # store desired default timeout on the session for convenience
@@ -44,16 +62,15 @@ class ProductClient:
 
 
 def dedupe(seq: Iterable[str]) -> list[str]:
-    seen = set()
-    out: list[str] = []
-    for x in seq:
-        if isinstance(x, str) and x and x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    return list(dict.fromkeys(x for x in seq if isinstance(x, str) and x))
 
 
 def parse_money_to_float(x: Any) -> float | None:
+    # JSON numbers need no Decimal round trip; float(Decimal(repr(x))) == x for finite values.
+    if type(x) is float:
+        return x if math.isfinite(x) else None
+    if type(x) is int:
+        return float(x)
     parsed = parse_decimal_money(x)
     if parsed is None:
         return None
@@ -76,6 +93,8 @@ _JSON_LD_SCRIPT_RE = re.compile(
     r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
     re.I | re.S,
 )
+_SLUG_TOKEN_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+_META_DESCRIPTION_LIMIT = 400
 
 
 def strip_html(text: str) -> str:
@@ -87,6 +106,20 @@ def truncate(text: str, limit: int = 400) -> str:
     return (text or "")[:limit].strip()
 
 
+def _strip_html_prefix(text: str, limit: int) -> str:
+    # Only the first `limit` characters survive truncation, so strip a prefix that ends on a
+    # tag boundary; its stripped text is then a prefix of the fully stripped text.
+    window = max(limit, 1) * 4
+    while window < len(text):
+        cut = text.rfind(">", 0, window) + 1
+        if cut:
+            stripped = strip_html(text[:cut])
+            if len(stripped) >= limit:
+                return stripped
+        window *= 2
+    return strip_html(text)
+
+
 def meta_from_description(
     title: str,
     description: str | None,
@@ -95,11 +128,18 @@ def meta_from_description(
 ) -> tuple[str, str | None]:
     if not description:
         return title, None
-    base = strip_html(description) if strip_html_content else description
-    return title, truncate(base)
+    base = (
+        _strip_html_prefix(description, _META_DESCRIPTION_LIMIT)
+        if strip_html_content
+        else description
+    )
+    return title, truncate(base, _META_DESCRIPTION_LIMIT)
 
 
 def to_int(value: Any) -> int | None:
+    # JSON stock counts are usually ints already; return them without the conversion call.
+    if type(value) is int:
+        return value
     if value is None or value == "":
         return None
     try:
@@ -139,7 +179,7 @@ def normalize_url(value: Any) -> str | None:
 
 
 def slug_token(value: Any) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", str(value or "").lower()).strip("-")
+    return _SLUG_TOKEN_SEPARATOR_RE.sub("-", str(value or "").lower()).strip("-")
 
 
 def extract_names(items: Any, *, split_commas: bool = False) -> list[str]:
@@ -226,9 +266,17 @@ def _extract_json_ld_nodes(data: Any, *, target_type: str) -> list[dict[str, Any
     return out
 
 
+def iter_json_ld_blocks(html: str) -> Iterator[str]:
+    for match in _JSON_LD_SCRIPT_RE.finditer(html or ""):
+        yield match.group(1)
+
+
 def extract_product_json_ld_nodes(html: str) -> list[dict[str, Any]]:
     products: list[dict[str, Any]] = []
-    for block in _JSON_LD_SCRIPT_RE.findall(html or ""):
+    for block in iter_json_ld_blocks(html):
+        # A Product node always spells its type as a JSON string; skip parsing other blocks.
+        if '"Product"' not in block:
+            continue
         try:
             data = json.loads(block.strip())
         except Exception:
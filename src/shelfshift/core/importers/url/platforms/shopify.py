@@ -1,5 +1,4 @@
 import json
-import re
 from urllib.parse import urlparse
 
 from ....canonical import (
@@ -16,16 +15,19 @@ from ....canonical import (
 from ....detect.url import extract_shopify_slug_from_path
 from ...unmapped_fields import platform_unmapped_key, set_unmapped_field
 from ..common import (
+    HTML_REQUEST_HEADERS,
     ProductClient,
     append_default_variant_if_empty,
     dedupe,
     finalize_product_typed_fields,
     http_session,
+    iter_json_ld_blocks,
     make_identifiers,
     make_price,
     meta_from_description,
     normalize_url,
     parse_money_to_float,
+    truncate,
 )
 
 
@@ -76,29 +78,19 @@ class ShopifyClient(ProductClient):
         return media
 
     def _fetch_from_html(self, url: str) -> Product:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-
-        response = self._http.get(url, headers=headers, timeout=self._http.request_timeout)
+        response = self._http.get(
+            url, headers=HTML_REQUEST_HEADERS, timeout=self._http.request_timeout
+        )
         response.raise_for_status()
         html = response.text
 
-        scripts = re.findall(
-            r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-            html,
-            re.I | re.S,
-        )
-        if not scripts:
-            raise ValueError("No JSON-LD found in HTML")
-
+        found_json_ld = False
         product_ld = None
-        for block in scripts:
+        for block in iter_json_ld_blocks(html):
+            found_json_ld = True
+            # Skip the parse for BreadcrumbList/Organization/etc. blocks.
+            if '"Product"' not in block:
+                continue
             try:
                 data = json.loads(block.strip())
             except Exception:
@@ -115,6 +107,8 @@ class ShopifyClient(ProductClient):
             if product_ld:
                 break
 
+        if not found_json_ld:
+            raise ValueError("No JSON-LD found in HTML")
         if not product_ld:
             raise ValueError("No Product JSON-LD found")
 
@@ -170,7 +164,7 @@ class ShopifyClient(ProductClient):
             options=[],
             seo=Seo(
                 title=title,
-                description=description[:400].strip() if description else None,
+                description=truncate(description) if description else None,
             ),
             source=SourceRef(
                 platform=self.platform,
@@ -242,20 +236,29 @@ class ShopifyClient(ProductClient):
             if raw_variant_id is not None and raw_sku:
                 sku_by_variant_id[str(raw_variant_id)] = raw_sku
 
-        image_by_id: dict[str, dict] = {}
+        # Variants often share an image; normalize each image once, not once per variant.
+        image_by_id: dict[str, tuple[str | None, str | None]] = {}
         for raw_image in data.get("images") or []:
             if isinstance(raw_image, dict) and raw_image.get("id") is not None:
-                image_by_id[str(raw_image.get("id"))] = raw_image
+                image_by_id[str(raw_image.get("id"))] = (
+                    normalize_url(raw_image.get("src")),
+                    raw_image.get("alt") or None,
+                )
 
+        # Shopify variants carry positional option1..option3 values for the product's options.
+        option_slots = [
+            (option_key, option.get("name"))
+            for option_key, option in zip(
+                ("option1", "option2", "option3"), data.get("options") or [], strict=False
+            )
+        ]
         if variants_list:
             for variant in variants_list:
                 variant_options: dict[str, str] = {}
-                if variant.get("option1") and data.get("options") and len(data["options"]) > 0:
-                    variant_options[data["options"][0]["name"]] = variant["option1"]
-                if variant.get("option2") and data.get("options") and len(data["options"]) > 1:
-                    variant_options[data["options"][1]["name"]] = variant["option2"]
-                if variant.get("option3") and data.get("options") and len(data["options"]) > 2:
-                    variant_options[data["options"][2]["name"]] = variant["option3"]
+                for option_key, option_name in option_slots:
+                    option_value = variant.get(option_key)
+                    if option_value and option_name:
+                        variant_options[option_name] = option_value
 
                 inventory_quantity = variant.get("inventory_quantity")
                 inventory_quantity = (
@@ -274,21 +277,21 @@ class ShopifyClient(ProductClient):
                 allow_backorder = (
                     True if inventory_policy == "continue" else False if inventory_policy else None
                 )
-                variant_image_raw = image_by_id.get(str(variant.get("image_id")))
+                variant_image_url, variant_image_alt = image_by_id.get(
+                    str(variant.get("image_id")), (None, None)
+                )
                 variant_media: list[Media] = []
-                if isinstance(variant_image_raw, dict):
-                    variant_image_url = normalize_url(variant_image_raw.get("src"))
-                    if variant_image_url:
-                        variant_media.append(
-                            Media(
-                                url=variant_image_url,
-                                type="image",
-                                alt=(variant_image_raw.get("alt") or None),
-                                position=1,
-                                is_primary=True,
-                                variant_skus=[raw_sku] if raw_sku else [],
-                            )
+                if variant_image_url:
+                    variant_media.append(
+                        Media(
+                            url=variant_image_url,
+                            type="image",
+                            alt=variant_image_alt,
+                            position=1,
+                            is_primary=True,
+                            variant_skus=[raw_sku] if raw_sku else [],
                         )
+                    )
 
                 variant_identifiers = make_identifiers(
                     {
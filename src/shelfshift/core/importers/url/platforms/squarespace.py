@@ -17,6 +17,7 @@ from ....canonical import (
 )
 from ....detect.url import detect_product_url
 from ..common import (
+    HTML_REQUEST_HEADERS,
     ProductClient,
     append_default_variant_if_empty,
     dedupe,
@@ -250,6 +251,16 @@ def _variant_product_options(variants: list[Variant]) -> dict[str, list[str]]:
     return {key: dedupe(values) for key, values in out.items() if values}
 
 
+def _append_variant_images(images: list[str], variants: list[Variant]) -> None:
+    # A set keeps this linear; checking membership in `images` per variant was quadratic.
+    seen = set(images)
+    for variant in variants:
+        variant_image_url = _variant_primary_image_url(variant)
+        if variant_image_url and variant_image_url not in seen:
+            seen.add(variant_image_url)
+            images.append(variant_image_url)
+
+
 def _variant_primary_image_url(variant: Variant) -> str | None:
     for media in variant.media:
         if media.type != "image":
@@ -348,10 +359,7 @@ def _parse_json_ld_product(
                         value=str(variant.title or variant.sku or variant.id or f"Variant {index}"),
                     )
                 ]
-    for variant in variants:
-        variant_image_url = _variant_primary_image_url(variant)
-        if variant_image_url and variant_image_url not in images:
-            images.append(variant_image_url)
+    _append_variant_images(images, variants)
 
     inferred_slug = slug
     if not inferred_slug:
@@ -686,10 +694,7 @@ def _parse_page_json_product(
                     )
                 ]
     option_defs = [OptionDef(name=name, values=values) for name, values in option_map.items()]
-    for variant in variants:
-        variant_image_url = _variant_primary_image_url(variant)
-        if variant_image_url and variant_image_url not in images:
-            images.append(variant_image_url)
+    _append_variant_images(images, variants)
 
     inferred_slug = (
         slug or pick_name(candidate.get("urlId")) or pick_name(structured_content.get("urlSlug"))
@@ -804,15 +809,9 @@ class SquarespaceClient(ProductClient):
         return _parse_page_json_product(candidate, payload, source_url=url, slug=slug)
 
     def _fetch_from_html(self, url: str, *, slug: str | None) -> Product:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-        response = self._http.get(url, headers=headers, timeout=self._http.request_timeout)
+        response = self._http.get(
+            url, headers=HTML_REQUEST_HEADERS, timeout=self._http.request_timeout
+        )
         response.raise_for_status()
 
         products = extract_product_json_ld_nodes(response.text)
@@ -1,5 +1,4 @@
 import json
-import re
 from typing import Any
 from urllib.parse import quote, urlparse
 
@@ -18,6 +17,7 @@ from ....canonical import (
 )
 from ....detect.url import detect_product_url, extract_woocommerce_store_api_product_token
 from ..common import (
+    HTML_REQUEST_HEADERS,
     ProductClient,
     append_default_variant_if_empty,
     dedupe,
@@ -58,7 +58,8 @@ def _parse_store_api_amount(raw: Any, *, minor_unit_value: int) -> float | None:
         stripped = raw.strip()
         if not stripped:
             return None
-        if re.fullmatch(r"-?\d+", stripped):
+        # Store API prices are integer minor units; isdecimal matches the digits \d would.
+        if stripped.removeprefix("-").isdecimal():
             return int(stripped) / (10**minor_unit_value)
         return parse_money_to_float(stripped)
     if isinstance(raw, int):
@@ -532,15 +533,9 @@ class WooCommerceClient(ProductClient):
         )
 
     def _fetch_from_html(self, url: str) -> Product:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-        response = self._http.get(url, headers=headers, timeout=self._http.request_timeout)
+        response = self._http.get(
+            url, headers=HTML_REQUEST_HEADERS, timeout=self._http.request_timeout
+        )
         response.raise_for_status()
 
         html = response.text
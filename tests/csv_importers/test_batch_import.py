@@ -300,6 +300,25 @@ def test_wix_batch_multi_variant_product() -> None:
     assert len(mug.variants) == 1
 
 
+def test_wix_batch_keeps_separator_only_option_choice() -> None:
+    csv_text = "\n".join(
+        [
+            "handle,fieldType,name,price,sku,inventory,media,weight,productOptionName1,productOptionType1,productOptionChoices1",
+            "tshirt,PRODUCT,T-Shirt,29.99,TS-1,10,,,Size,TEXT_CHOICES,;",
+        ]
+    )
+
+    products = import_products_from_csv(
+        source_platform="wix",
+        csv_bytes=csv_text.encode("utf-8"),
+        source_weight_unit="kg",
+    )
+
+    variant = products[0].variants[0]
+    assert variant.title == ";"
+    assert [(value.name, value.value) for value in variant.option_values] == [("Size", ";")]
+
+
 def test_wix_batch_provenance() -> None:
     csv_text = "\n".join(
         [
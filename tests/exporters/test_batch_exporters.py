@@ -1,4 +1,5 @@
 import io
+from datetime import datetime, timezone
 
 import pandas as pd
 import pytest
@@ -296,3 +297,36 @@ def test_batch_exporters_use_product_visibility_when_publish_is_none() -> None:
     shopify_frame = pd.read_csv(io.StringIO(shopify_csv), dtype=str, keep_default_na=False)
     assert shopify_frame.loc[0, "Published on online store"] == "TRUE"
     assert shopify_frame.loc[0, "Status"] == "Active"
+
+
+def test_batch_exports_share_caller_supplied_timestamp() -> None:
+    product = Product(
+        source={"platform": "shopify", "id": "1", "slug": "alpha"},
+        title="Alpha Product",
+        variants=[Variant(id="v1", sku="ALPHA-1", price_amount=10.0)],
+    )
+    now = datetime(2026, 3, 1, 12, 30, 45, tzinfo=timezone.utc)
+
+    _, shopify_filename = products_to_shopify_csv([product], now=now)
+    _, squarespace_filename = products_to_squarespace_csv([product], now=now)
+
+    assert shopify_filename == "shopify-20260301T123045Z.csv"
+    assert squarespace_filename == "squarespace-20260301T123045Z.csv"
+
+
+def test_batch_exports_match_serial_output_when_parallel() -> None:
+    products = [
+        Product(
+            source={"platform": "shopify", "id": str(index), "slug": f"item-{index}"},
+            title=f"Item {index}",
+            variants=[Variant(id="v1", sku=f"ITEM-{index}", price_amount=10.0 + index)],
+        )
+        for index in range(3)
+    ]
+
+    serial_csv, _ = products_to_wix_csv(products, publish=True)
+    parallel_csv, _ = products_to_wix_csv(products, publish=True, workers=2)
+
+    assert parallel_csv == serial_csv
+    with pytest.raises(ValueError, match="Duplicate WooCommerce parent SKU"):
+        products_to_woocommerce_csv([products[0], products[0]], workers=2)
@@ -16,6 +16,7 @@ from shelfshift.core.exporters import product_to_bigcommerce_csv
 from shelfshift.core.exporters.platforms.bigcommerce import (
     BIGCOMMERCE_COLUMNS,
     BIGCOMMERCE_LEGACY_COLUMNS,
+    product_to_bigcommerce_rows,
 )
 
 
@@ -139,6 +140,9 @@ def test_bigcommerce_export_simple_product_uses_product_and_image_rows() -> None
     assert frame.loc[1, "Item"] == "Image"
     assert frame.loc[1, "Image URL (Import)"] == "https://cdn.example.com/mug.jpg"
 
+    rows = product_to_bigcommerce_rows(product, publish=True)
+    assert all(list(row) == BIGCOMMERCE_COLUMNS for row in rows)
+
 
 def test_bigcommerce_export_uses_swatch_only_when_value_data_is_present() -> None:
     product = Product(
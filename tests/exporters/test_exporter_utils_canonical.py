@@ -1,6 +1,9 @@
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-from shelfshift.core.canonical import Product, SourceRef, Variant, Weight
+import pytest
+
+from shelfshift.core.canonical import OptionDef, Product, SourceRef, Variant, Weight
 from shelfshift.core.exporters.shared import utils
 
 
@@ -30,3 +33,63 @@ def test_resolve_variant_available_prefers_inventory_available() -> None:
     )
 
     assert utils.resolve_variant_available(variant) is True
+
+
+def test_tidy_tags_dedupes_and_sorts_case_insensitively() -> None:
+    product = Product(
+        source=SourceRef(platform="shopify", id="p-1"),
+        tags=["beta", " Alpha ", "Beta", "", "gamma", "alpha"],
+    )
+
+    assert utils.tidy_tags(product) == ("Alpha", "beta", "gamma")
+
+
+def test_resolve_option_names_skips_blank_names_and_honours_limit() -> None:
+    product = Product(
+        source=SourceRef(platform="shopify", id="p-1"),
+        options=[
+            OptionDef(name=" Size ", values=["S", "M"]),
+            OptionDef(name="", values=["x"]),
+            OptionDef(name="Color", values=["Red"]),
+            OptionDef(name="Material", values=["Wood"]),
+        ],
+    )
+
+    assert utils.resolve_option_names(product) == ["Size", "Color", "Material"]
+    assert utils.resolve_option_names(product, limit=2) == ["Size", "Color"]
+
+
+def test_join_unique_strips_skips_blanks_and_keeps_first_occurrence() -> None:
+    assert utils.join_unique([" a ", "b", "", "a", None, "c"], ",") == "a,b,c"
+
+
+def test_dict_rows_to_csv_fills_missing_cells_and_rejects_unknown_keys() -> None:
+    assert utils.dict_rows_to_csv([{"b": "2"}], ["a", "b"]) == "a,b\n,2\n"
+
+    with pytest.raises(ValueError, match="'Handel'"):
+        utils.dict_rows_to_csv([{"a": "1", "Handel": "x"}], ["a", "b"])
+
+
+def test_make_export_filename_collapses_unsafe_runs() -> None:
+    now = datetime(2026, 2, 8, tzinfo=timezone.utc)
+
+    assert utils.make_export_filename("My__Shop  Export!!", now=now) == (
+        "my-shop-export-20260208T000000Z.csv"
+    )
+    assert utils.make_export_filename("--shopify--", now=now) == "shopify-20260208T000000Z.csv"
+    assert utils.make_export_filename("", now=now) == "export-20260208T000000Z.csv"
+
+
+def test_make_export_filename_replaces_non_ascii_characters() -> None:
+    now = datetime(2026, 2, 8, tzinfo=timezone.utc)
+
+    assert utils.make_export_filename("Shöp Ïfy", now=now) == "sh-p-fy-20260208T000000Z.csv"
+    assert utils.make_export_filename("ウィックス", now=now) == "export-20260208T000000Z.csv"
+
+
+def test_make_export_filename_uses_now_override_in_utc() -> None:
+    naive = datetime(2026, 2, 8, 12, 30, 45)
+    offset = datetime(2026, 2, 8, 14, 30, 45, tzinfo=timezone(timedelta(hours=2)))
+
+    assert utils.make_export_filename("wix", now=naive) == "wix-20260208T123045Z.csv"
+    assert utils.make_export_filename("wix", now=offset) == "wix-20260208T123045Z.csv"
@@ -13,7 +13,11 @@ from shelfshift.core.canonical import (
     Price,
 )
 from shelfshift.core.exporters import product_to_shopify_csv
-from shelfshift.core.exporters.platforms.shopify import SHOPIFY_COLUMNS, SHOPIFY_DEFAULT_IMAGE_URL
+from shelfshift.core.exporters.platforms.shopify import (
+    SHOPIFY_COLUMNS,
+    SHOPIFY_DEFAULT_IMAGE_URL,
+    product_to_shopify_rows,
+)
 
 
 def test_single_variant_uses_default_title_option() -> None:
@@ -380,3 +384,20 @@ def test_typed_fields_override_legacy_values_when_present() -> None:
     assert frame.loc[0, "Product image URL"] == "https://cdn.example.com/typed-main.jpg"
     assert frame.loc[1, "Product image URL"] == "https://cdn.example.com/typed-gallery.jpg"
     assert frame.loc[0, "Variant image URL"] == "https://cdn.example.com/typed-variant.jpg"
+
+
+def test_product_to_shopify_rows_returns_header_keyed_dicts() -> None:
+    product = Product(
+        platform="amazon",
+        id="B000111",
+        title="Demo Mug",
+        price={"amount": 12.0, "currency": "USD"},
+        images=["https://cdn.example.com/a.jpg", "https://cdn.example.com/b.jpg"],
+    )
+
+    rows = product_to_shopify_rows(product, publish=False)
+
+    assert len(rows) == 2
+    assert all(list(row) == SHOPIFY_COLUMNS for row in rows)
+    assert rows[0]["Title"] == "Demo Mug"
+    assert rows[1]["Image position"] == "2"
@@ -5,7 +5,7 @@ from tests.helpers._model_builders import Product, Variant
 
 from shelfshift.core.canonical import Inventory, Media, Money, OptionDef, OptionValue, Price
 from shelfshift.core.exporters import product_to_wix_csv
-from shelfshift.core.exporters.platforms.wix import WIX_COLUMNS
+from shelfshift.core.exporters.platforms.wix import WIX_COLUMNS, product_to_wix_rows
 
 
 def test_wix_export_maps_product_and_variant_rows() -> None:
@@ -119,6 +119,10 @@ def test_wix_export_emits_media_rows_for_additional_images() -> None:
     assert frame.loc[3, "fieldType"] == "MEDIA"
     assert frame.loc[3, "media"] == "https://cdn.example.com/tee-3.jpg"
 
+    rows = product_to_wix_rows(product, publish=True)
+    assert all(list(row) == WIX_COLUMNS for row in rows)
+    assert rows[2]["fieldType"] == "MEDIA"
+
 
 def test_wix_export_supports_lb_weight_unit() -> None:
     product = Product(
@@ -184,6 +188,23 @@ def test_wix_export_truncates_using_utf16_units_for_wix_limits() -> None:
     assert exported_description == "A" * 15999
 
 
+def test_wix_export_truncates_non_ascii_bmp_text_by_code_points() -> None:
+    product = Product(
+        platform="shopify",
+        id="101",
+        title="é" * 100,
+        description="Описание",
+        price={"amount": 19.99, "currency": "USD"},
+        variants=[Variant(id="v1", sku="TEE-1", price_amount=19.99)],
+    )
+
+    csv_text, _ = product_to_wix_csv(product, publish=True)
+    frame = read_frame(csv_text)
+
+    assert frame.loc[0, "name"] == "é" * 80
+    assert frame.loc[0, "plainDescription"] == "Описание"
+
+
 def test_wix_export_prefers_typed_fields_when_present() -> None:
     product = Product(
         platform="shopify",
@@ -13,7 +13,11 @@ from shelfshift.core.canonical import (
     Price,
 )
 from shelfshift.core.exporters import product_to_woocommerce_csv
-from shelfshift.core.exporters.platforms.woocommerce import woocommerce_columns_for_weight_unit
+from shelfshift.core.exporters.platforms.woocommerce import (
+    product_to_woocommerce_csv_stream,
+    product_to_woocommerce_rows,
+    woocommerce_columns_for_weight_unit,
+)
 
 
 def test_simple_product_maps_qty_stock() -> None:
@@ -249,6 +253,10 @@ def test_woocommerce_export_uses_requested_weight_unit_header() -> None:
         assert header in frame.columns
         assert frame.loc[0, header] == expected
 
+        rows = product_to_woocommerce_rows(product, publish=False, weight_unit=unit)
+        assert list(rows[0]) == woocommerce_columns_for_weight_unit(unit)
+        assert rows[0][header] == expected
+
 
 def test_woocommerce_export_replays_unmapped_fields_for_noncanonical_headers() -> None:
     product = Product(
@@ -277,3 +285,65 @@ def test_woocommerce_export_replays_unmapped_fields_for_noncanonical_headers() -
     assert frame.loc[0, "Is featured?"] == "1"
     assert frame.loc[0, "Type"] == "simple"
     assert frame.loc[0, "Sale price"] == "10"
+
+
+def test_colliding_variation_keys_get_sequential_suffixes() -> None:
+    product = Product(
+        platform="shopify",
+        id="101",
+        title="Classic Tee",
+        price={"amount": 19.99, "currency": "USD"},
+        images=[],
+        variants=[
+            Variant(id="dup", title="Black", price_amount=19.99),
+            Variant(id="dup", title="White", price_amount=19.99),
+            Variant(id="dup-2", title="Grey", price_amount=19.99),
+            Variant(id="dup", title="Red", price_amount=19.99),
+        ],
+    )
+
+    csv_text, _ = product_to_woocommerce_csv(product, publish=False)
+    frame = read_frame(csv_text)
+
+    assert list(frame.loc[1:, "SKU"]) == [
+        "SH:101:dup",
+        "SH:101:dup-2",
+        "SH:101:dup-2-2",
+        "SH:101:dup-3",
+    ]
+
+
+def test_woocommerce_csv_stream_yields_header_then_one_chunk_per_row() -> None:
+    product = Product(
+        platform="shopify",
+        id="101",
+        title="Classic Tee",
+        price={"amount": 19.99, "currency": "USD"},
+        variants=[
+            Variant(id="v1", sku="TEE-BLK", title="Black", price_amount=19.99),
+            Variant(id="v2", sku="TEE-WHT", title="White", price_amount=21.99),
+        ],
+    )
+
+    chunks = list(product_to_woocommerce_csv_stream(product, publish=True))
+    csv_text, _ = product_to_woocommerce_csv(product, publish=True)
+
+    assert len(chunks) == 4
+    assert chunks[0] == ",".join(woocommerce_columns_for_weight_unit("kg")) + "\n"
+    assert "".join(chunks) == csv_text
+
+
+def test_short_description_strips_tags_but_keeps_bare_angle_brackets() -> None:
+    product = Product(
+        platform="shopify",
+        id="101",
+        title="Scale",
+        description="<p>Holds 5 < 10 kg</p><!-- note --><br/>Fits > 3 bins",
+        price={"amount": 5.0, "currency": "USD"},
+        variants=[Variant(id="v1", sku="SCALE-1", price_amount=5.0)],
+    )
+
+    csv_text, _ = product_to_woocommerce_csv(product, publish=True)
+    frame = read_frame(csv_text)
+
+    assert frame.loc[0, "Short description"] == "Holds 5 < 10 kg Fits > 3 bins"
@@ -109,3 +109,11 @@ def test_detect_amazon_and_aliexpress_urls() -> None:
     assert aliexpress["is_product"] is True
     assert aliexpress["product_id"] == "1005008518647948"
     assert aliexpress["slug"] is None
+
+
+def test_detect_product_url_returns_independent_copies() -> None:
+    url = "https://demo.myshopify.com/products/red-rain-coat"
+    first = detect_product_url(url)
+    first["platform"] = "mutated"
+
+    assert detect_product_url(url)["platform"] == "shopify"
@@ -40,3 +40,15 @@ def test_import_products_from_urls_collects_unsupported_platform_errors(monkeypa
 def test_core_import_url_strict_raises_for_unsupported_platforms() -> None:
     with pytest.raises(ValueError, match="Strict mode failed with 1 URL import error"):
         core_api.import_url([_AMAZON_URL], strict=True)
+
+
+def test_import_products_from_urls_with_workers_keeps_input_order(monkeypatch) -> None:
+    monkeypatch.setattr(url_importers, "_fetch_product_details", lambda url: url)
+    urls = [f"https://demo.myshopify.com/products/item-{index}" for index in range(8)]
+
+    products, errors = url_importers.import_products_from_urls(
+        [*urls[:4], _AMAZON_URL, *urls[4:]], workers=4
+    )
+
+    assert products == urls
+    assert [error["url"] for error in errors] == [_AMAZON_URL]
@@ -0,0 +1,21 @@
+from shelfshift.core.importers.url.common import meta_from_description, strip_html, truncate
+
+
+def test_meta_from_description_matches_full_strip_for_long_html() -> None:
+    description = "".join(
+        f'<p class="copy">Paragraph {index} with <b>bold</b> &amp; text</p>\n'
+        for index in range(500)
+    )
+
+    _, meta_description = meta_from_description("Title", description, strip_html_content=True)
+
+    assert meta_description == truncate(strip_html(description))
+
+
+def test_meta_from_description_handles_short_and_tagless_text() -> None:
+    assert meta_from_description("T", "<p>Short</p>", strip_html_content=True) == ("T", "Short")
+    assert meta_from_description("T", "plain " * 200, strip_html_content=True) == (
+        "T",
+        truncate(strip_html("plain " * 200)),
+    )
+    assert meta_from_description("T", "", strip_html_content=True) == ("T", None)
@@ -74,3 +74,21 @@ def test_product_is_published_normalization_and_serialization() -> None:
 
     assert product.is_published is True
     assert payload["is_published"] is True
+
+
+def test_option_payload_values_accept_any_iterable() -> None:
+    product = Product(
+        options=[
+            {"name": "Color", "values": ("Black", "White", "Black")},
+            {"name": "Size", "values": "M"},
+            {"name": "Pack", "values": 2},
+            {"name": "Fit", "values": (value for value in ["Slim", "Regular"])},
+        ]
+    )
+
+    assert [(option.name, option.values) for option in product.options] == [
+        ("Color", ["Black", "White"]),
+        ("Size", ["M"]),
+        ("Pack", ["2"]),
+        ("Fit", ["Slim", "Regular"]),
+    ]
@@ -20,3 +20,12 @@ def test_models_module_exports_shared_types_and_formatting_helpers() -> None:
     assert parse_decimal_money("1.23") == Decimal("1.23")
     assert normalize_currency(" usd ") == "USD"
     assert format_decimal(Decimal("1.2300")) == "1.23"
+
+
+def test_parse_decimal_money_handles_plain_and_formatted_strings() -> None:
+    assert parse_decimal_money(" 19.99 ") == Decimal("19.99")
+    assert parse_decimal_money("1299") == Decimal("1299")
+    assert parse_decimal_money("$1,299.00 USD") == Decimal("1299.00")
+    assert parse_decimal_money("-5") == Decimal("-5")
+    assert parse_decimal_money("1.2.3") is None
+    assert parse_decimal_money(".") is None